@@ -28,6 +28,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown: Disconnect DBs
     print("Shutting down...")
+    await recommendation.rec_service.aclose()
 
 from app.routers import auth, friends, internal_ingestion, recommendation, users
 
@@ -1,3 +1,5 @@
+import importlib.util
+import json
 import logging
 import os
 from typing import Any
@@ -5,6 +7,14 @@ from typing import Any
 import httpx
 from fastapi import HTTPException, status
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# HTTP/2 needs the optional "h2" package (httpx[http2]); fall back to HTTP/1.1 without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger("app.kakao_local")
 
 
@@ -15,6 +25,24 @@ class KakaoLocalService:
 
     def __init__(self) -> None:
         self.timeout = httpx.Timeout(10.0, connect=3.0)
+        self.limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        self._client: httpx.AsyncClient | None = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled client so TLS connections stay warm across requests."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_headers(self) -> dict[str, str]:
         rest_api_key = os.getenv("KAKAO_REST_API_KEY")
@@ -60,9 +88,15 @@ class KakaoLocalService:
                 ),
             )
 
-        payload = response.json()
+        payload = self._loads(response.content)
         return payload.get("documents", [])
 
+    @staticmethod
+    def _loads(content: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
     async def search_stations(
         self,
         client: httpx.AsyncClient,
@@ -1,5 +1,7 @@
 import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import functools
 import hashlib
 import json
 import logging
@@ -271,6 +273,9 @@ class RecommendationService:
         self.ingestion_min_recrawl_minutes = self._get_int_env(
             "MIDPOINT_INGESTION_MIN_RECRAWL_MINUTES", default=180, minimum=0
         )
+        self.memory_cache_max_entries = self._get_int_env(
+            "MIDPOINT_MEMORY_CACHE_MAX_ENTRIES", default=256, minimum=1
+        )
 
         self._redis_client: Redis | None = None
         self._redis_enabled = False
@@ -285,9 +290,14 @@ class RecommendationService:
                 logger.exception("Failed to initialize Redis cache client; using memory cache")
                 self._redis_client = None
                 self._redis_enabled = False
-        self._memory_cache: dict[str, tuple[float, str]] = {}
+        # LRU of cache_key -> (monotonic expires_at, serialized response).
+        self._memory_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
         self._memory_cache_lock = asyncio.Lock()
 
+    async def aclose(self) -> None:
+        """Release the pooled Kakao client; called from the app lifespan on shutdown."""
+        await self.kakao_local_service.aclose()
+
     @staticmethod
     def _get_int_env(name: str, default: int, minimum: int) -> int:
         raw_value = os.getenv(name)
@@ -663,6 +673,21 @@ class RecommendationService:
         normalized = _normalize_keyword(keyword)
         return KEYWORD_TO_SEARCH_PHRASE.get(normalized, keyword)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_station_keyword_queries(raw_station_name: str) -> tuple[tuple[str, str, str], ...]:
+        """Return (keyword, search_phrase, query) for every predefined keyword at a station.
+
+        Stations repeat across requests, so the formatted queries are cached per station name.
+        """
+        query_station_name = RecommendationService._build_station_keyword(raw_station_name)
+        queries: list[tuple[str, str, str]] = []
+        for keyword in PREDEFINED_PLAY_KEYWORDS:
+            keyword_search_phrase = RecommendationService._build_keyword_search_phrase(keyword)
+            query = f"{query_station_name} {keyword_search_phrase}".strip()
+            queries.append((keyword, keyword_search_phrase, query))
+        return tuple(queries)
+
     @staticmethod
     def _normalize_place_filter_text(raw_text: object | None) -> str:
         if not isinstance(raw_text, str):
@@ -770,6 +795,7 @@ class RecommendationService:
             if expires_at <= now:
                 self._memory_cache.pop(cache_key, None)
                 return None, "memory"
+            self._memory_cache.move_to_end(cache_key)
         try:
             return MidpointHotplaceResponse.model_validate_json(payload), "memory"
         except Exception:
@@ -794,6 +820,9 @@ class RecommendationService:
         expires_at = time.monotonic() + self.cache_ttl_seconds
         async with self._memory_cache_lock:
             self._memory_cache[cache_key] = (expires_at, payload)
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.memory_cache_max_entries:
+                self._memory_cache.popitem(last=False)
         return "memory"
 
     def _build_station(self, station_doc: dict) -> MidpointStation | None:
@@ -964,46 +993,45 @@ class RecommendationService:
         return "기타"
 
     @staticmethod
-    def _haversine_distance_km(
-        from_lat: float,
-        from_lng: float,
-        to_lat: float,
-        to_lng: float,
-    ) -> float:
-        lat_delta = math.radians(to_lat - from_lat)
-        lng_delta = math.radians(to_lng - from_lng)
-        from_lat_rad = math.radians(from_lat)
-        to_lat_rad = math.radians(to_lat)
-        haversine = (
-            math.sin(lat_delta / 2) ** 2
-            + math.cos(from_lat_rad) * math.cos(to_lat_rad) * (math.sin(lng_delta / 2) ** 2)
-        )
-        haversine = max(0.0, min(1.0, haversine))
-        arc = 2 * math.atan2(math.sqrt(haversine), math.sqrt(1 - haversine))
-        return EARTH_RADIUS_KM * arc
+    def _build_participant_origins(
+        request: MidpointHotplaceRequest,
+    ) -> list[tuple[float, float, float]]:
+        """Precompute (lat_rad, lng_rad, cos(lat)) per participant for repeated haversine calls."""
+        origins: list[tuple[float, float, float]] = []
+        for participant in request.participants:
+            lat_rad = math.radians(participant.lat)
+            origins.append((lat_rad, math.radians(participant.lng), math.cos(lat_rad)))
+        return origins
 
     def _calculate_distance_score(
         self,
         hotplace: MidpointHotplace,
         request: MidpointHotplaceRequest,
+        participant_origins: list[tuple[float, float, float]] | None = None,
     ) -> tuple[float, float | None, float | None]:
         if not (-90 <= hotplace.y <= 90 and -180 <= hotplace.x <= 180):
             return NEUTRAL_COMPONENT_SCORE, None, None
         if abs(hotplace.x) < 1e-9 and abs(hotplace.y) < 1e-9:
             return NEUTRAL_COMPONENT_SCORE, None, None
 
-        participant_distances = [
-            self._haversine_distance_km(
-                from_lat=participant.lat,
-                from_lng=participant.lng,
-                to_lat=hotplace.y,
-                to_lng=hotplace.x,
-            )
-            for participant in request.participants
-        ]
-        if not participant_distances:
+        if participant_origins is None:
+            participant_origins = self._build_participant_origins(request)
+        if not participant_origins:
             return NEUTRAL_COMPONENT_SCORE, None, None
 
+        to_lat_rad = math.radians(hotplace.y)
+        to_lng_rad = math.radians(hotplace.x)
+        to_lat_cos = math.cos(to_lat_rad)
+        participant_distances: list[float] = []
+        for from_lat_rad, from_lng_rad, from_lat_cos in participant_origins:
+            haversine = (
+                math.sin((to_lat_rad - from_lat_rad) / 2) ** 2
+                + from_lat_cos * to_lat_cos * (math.sin((to_lng_rad - from_lng_rad) / 2) ** 2)
+            )
+            haversine = max(0.0, min(1.0, haversine))
+            arc = 2 * math.atan2(math.sqrt(haversine), math.sqrt(1 - haversine))
+            participant_distances.append(EARTH_RADIUS_KM * arc)
+
         avg_distance = sum(participant_distances) / len(participant_distances)
         if len(participant_distances) > 1:
             variance = sum(
@@ -1103,6 +1131,7 @@ class RecommendationService:
 
         weather_key = self._normalize_weather_key(request.weather_key)
         weights = self._resolve_ranking_weights(weather_key)
+        participant_origins = self._build_participant_origins(request)
         ranked_hotplaces: list[MidpointHotplace] = []
 
         for hotplace in hotplaces:
@@ -1113,6 +1142,7 @@ class RecommendationService:
             distance_score, avg_distance_km, _distance_std_km = self._calculate_distance_score(
                 hotplace,
                 request,
+                participant_origins,
             )
             rating_score, confidence_score, _bayesian_rating = (
                 self._calculate_rating_score_and_confidence(hotplace)
@@ -1223,18 +1253,42 @@ class RecommendationService:
                 exc_info=True,
             )
 
+    @staticmethod
+    async def _gather_fail_fast(coros: list) -> list:
+        """Like asyncio.gather, but cancels the remaining tasks as soon as one fails."""
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        if not tasks:
+            return []
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            errors = [
+                task.exception()
+                for task in tasks
+                if task in done and not task.cancelled() and task.exception() is not None
+            ]
+            if errors:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise errors[0]
+            return [task.result() for task in tasks]
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _fetch_keyword_page(
         self,
         client: httpx.AsyncClient,
         station: MidpointStation,
         keyword: str,
+        keyword_search_phrase: str,
+        query: str,
         page: int,
         request: MidpointHotplaceRequest,
         semaphore: asyncio.Semaphore,
     ) -> tuple[str, str, list[dict]]:
-        query_station_name = self._build_station_keyword(station.original_name)
-        keyword_search_phrase = self._build_keyword_search_phrase(keyword)
-        query = f"{query_station_name} {keyword_search_phrase}".strip()
         try:
             async with semaphore:
                 documents = await self.kakao_local_service.search_places_by_keyword(
@@ -1361,105 +1415,106 @@ class RecommendationService:
                 len(applied_keywords),
             )
 
-        async with httpx.AsyncClient(
-            base_url=self.kakao_local_service.BASE_URL,
-            timeout=self.kakao_local_service.timeout,
-        ) as client:
-            station_docs = await self.kakao_local_service.search_stations(
-                client=client,
-                mid_lat=midpoint.lat,
-                mid_lng=midpoint.lng,
-                radius=request.station_radius,
-                limit=applied_station_limit,
+        client = self.kakao_local_service.get_client()
+        station_docs = await self.kakao_local_service.search_stations(
+            client=client,
+            mid_lat=midpoint.lat,
+            mid_lng=midpoint.lng,
+            radius=request.station_radius,
+            limit=applied_station_limit,
+        )
+        if self.log_full_kakao_results:
+            logger.info(
+                "KAKAO_RAW_STATION_RESULTS midpoint=(%.6f, %.6f) documents=%s",
+                midpoint.lat,
+                midpoint.lng,
+                self._to_json_log(station_docs),
             )
-            if self.log_full_kakao_results:
-                logger.info(
-                    "KAKAO_RAW_STATION_RESULTS midpoint=(%.6f, %.6f) documents=%s",
-                    midpoint.lat,
-                    midpoint.lng,
-                    self._to_json_log(station_docs),
-                )
-            actual_kakao_calls = 1
+        actual_kakao_calls = 1
 
-            chosen_stations: list[MidpointStation] = []
-            for station_doc in station_docs:
-                station = self._build_station(station_doc)
-                if station:
-                    chosen_stations.append(station)
+        chosen_stations: list[MidpointStation] = []
+        for station_doc in station_docs:
+            station = self._build_station(station_doc)
+            if station:
+                chosen_stations.append(station)
 
-            chosen_stations = chosen_stations[:applied_station_limit]
+        chosen_stations = chosen_stations[:applied_station_limit]
 
-            if not chosen_stations:
-                logger.info(
-                    "Midpoint hotplace result: no stations found near midpoint=(%.6f, %.6f)",
-                    midpoint.lat,
-                    midpoint.lng,
-                )
-                return MidpointHotplaceResponse(
-                    midpoint=midpoint,
-                    chosen_stations=[],
-                    hotplaces=[],
-                    meta=MidpointHotplaceMeta(
-                        participant_count=len(request.participants),
-                        station_radius=request.station_radius,
-                        station_limit=applied_station_limit,
-                        place_radius=request.place_radius,
-                        keywords=applied_keywords,
-                        size=request.size,
-                        pages=applied_pages,
-                        station_count=0,
-                        hotplace_count=0,
-                        keyword_request_count=0,
-                        kakao_api_call_count=actual_kakao_calls,
-                        executed_keyword_count=0,
-                        expected_kakao_api_call_count=expected_kakao_calls,
-                        actual_kakao_api_call_count=actual_kakao_calls,
-                        ranking_weather_key=normalized_weather_key,
-                        cache_hit=False,
-                        cache_backend=cache_backend,
-                        cache_ttl_seconds=self.cache_ttl_seconds,
-                    ),
-                )
+        if not chosen_stations:
+            logger.info(
+                "Midpoint hotplace result: no stations found near midpoint=(%.6f, %.6f)",
+                midpoint.lat,
+                midpoint.lng,
+            )
+            return MidpointHotplaceResponse(
+                midpoint=midpoint,
+                chosen_stations=[],
+                hotplaces=[],
+                meta=MidpointHotplaceMeta(
+                    participant_count=len(request.participants),
+                    station_radius=request.station_radius,
+                    station_limit=applied_station_limit,
+                    place_radius=request.place_radius,
+                    keywords=applied_keywords,
+                    size=request.size,
+                    pages=applied_pages,
+                    station_count=0,
+                    hotplace_count=0,
+                    keyword_request_count=0,
+                    kakao_api_call_count=actual_kakao_calls,
+                    executed_keyword_count=0,
+                    expected_kakao_api_call_count=expected_kakao_calls,
+                    actual_kakao_api_call_count=actual_kakao_calls,
+                    ranking_weather_key=normalized_weather_key,
+                    cache_hit=False,
+                    cache_backend=cache_backend,
+                    cache_ttl_seconds=self.cache_ttl_seconds,
+                ),
+            )
 
-            semaphore = asyncio.Semaphore(self.keyword_concurrency)
-            tasks = [
-                self._fetch_keyword_page(
-                    client=client,
-                    station=station,
-                    keyword=keyword,
-                    page=page,
-                    request=request,
-                    semaphore=semaphore,
-                )
-                for station in chosen_stations
-                for keyword in applied_keywords
-                for page in range(1, applied_pages + 1)
-            ]
-            try:
-                keyword_results = await asyncio.gather(*tasks)
-            except Exception as exc:
-                logger.exception(
-                    "Midpoint keyword batch failed: midpoint=(%.6f, %.6f) stations=%s",
-                    midpoint.lat,
-                    midpoint.lng,
-                    [station.original_name for station in chosen_stations],
-                )
-                if isinstance(exc, HTTPException):
-                    raise HTTPException(
-                        status_code=exc.status_code,
-                        detail=(
-                            f"{exc.detail}. "
-                            "The entire midpoint-hotplaces request failed due to all-or-nothing policy."
-                        ),
-                    ) from exc
+        semaphore = asyncio.Semaphore(self.keyword_concurrency)
+        tasks = [
+            self._fetch_keyword_page(
+                client=client,
+                station=station,
+                keyword=keyword,
+                keyword_search_phrase=keyword_search_phrase,
+                query=query,
+                page=page,
+                request=request,
+                semaphore=semaphore,
+            )
+            for station in chosen_stations
+            for keyword, keyword_search_phrase, query in self._build_station_keyword_queries(
+                station.original_name
+            )
+            for page in range(1, applied_pages + 1)
+        ]
+        try:
+            keyword_results = await self._gather_fail_fast(tasks)
+        except Exception as exc:
+            logger.exception(
+                "Midpoint keyword batch failed: midpoint=(%.6f, %.6f) stations=%s",
+                midpoint.lat,
+                midpoint.lng,
+                [station.original_name for station in chosen_stations],
+            )
+            if isinstance(exc, HTTPException):
                 raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    status_code=exc.status_code,
                     detail=(
-                        "Midpoint-hotplaces request failed due to one or more keyword search failures "
-                        "(all-or-nothing policy)."
+                        f"{exc.detail}. "
+                        "The entire midpoint-hotplaces request failed due to all-or-nothing policy."
                     ),
                 ) from exc
-            actual_kakao_calls += len(tasks)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=(
+                    "Midpoint-hotplaces request failed due to one or more keyword search failures "
+                    "(all-or-nothing policy)."
+                ),
+            ) from exc
+        actual_kakao_calls += len(tasks)
 
         deduped_hotplaces: dict[str, MidpointHotplace] = {}
         for source_station, source_keyword, place_docs in keyword_results:
@@ -8,12 +8,40 @@ import httpx
 from fastapi import HTTPException
 
 from app.schemas.recommendation import MidpointHotplace, MidpointHotplaceRequest
+from app.services.kakao_local_service import KakaoLocalService
 from app.services.recommendation_service import (
     PREDEFINED_PLAY_KEYWORDS,
     RecommendationService,
 )
 
 
+def _build_fake_place_documents(keyword: str) -> list[dict]:
+    return [
+        {
+            "id": f"place-{keyword}",
+            "place_name": f"{keyword}-테스트장소",
+            "x": "127.0276",
+            "y": "37.4979",
+            "distance": "120",
+        }
+    ]
+
+
+FAKE_STATION_DOCUMENTS = [
+    {
+        "id": "station-1",
+        "place_name": "강남역",
+        "x": "127.0276",
+        "y": "37.4979",
+        "distance": "80",
+    }
+]
+FAKE_PLACE_DOCUMENTS_BY_PHRASE = {
+    phrase: _build_fake_place_documents(phrase)
+    for phrase in map(RecommendationService._build_keyword_search_phrase, PREDEFINED_PLAY_KEYWORDS)
+}
+
+
 class FakeKakaoLocalService:
     BASE_URL = "https://example.com"
     timeout = httpx.Timeout(5.0)
@@ -22,18 +50,17 @@ class FakeKakaoLocalService:
         self.fail_keyword = fail_keyword
         self.station_calls = 0
         self.keyword_queries: list[str] = []
+        self.client = httpx.AsyncClient(base_url=self.BASE_URL, timeout=self.timeout)
+
+    def get_client(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
 
     async def search_stations(self, **kwargs):
         self.station_calls += 1
-        return [
-            {
-                "id": "station-1",
-                "place_name": "강남역",
-                "x": "127.0276",
-                "y": "37.4979",
-                "distance": "80",
-            }
-        ]
+        return FAKE_STATION_DOCUMENTS
 
     async def search_places_by_keyword(self, *, query: str, **kwargs):
         self.keyword_queries.append(query)
@@ -41,15 +68,10 @@ class FakeKakaoLocalService:
             raise HTTPException(status_code=503, detail=f"forced keyword failure: {query}")
 
         keyword = query.split(" ", 1)[1]
-        return [
-            {
-                "id": f"place-{keyword}",
-                "place_name": f"{keyword}-테스트장소",
-                "x": "127.0276",
-                "y": "37.4979",
-                "distance": "120",
-            }
-        ]
+        documents = FAKE_PLACE_DOCUMENTS_BY_PHRASE.get(keyword)
+        if documents is None:
+            documents = _build_fake_place_documents(keyword)
+        return documents
 
 
 def _build_request() -> MidpointHotplaceRequest:
@@ -67,10 +89,12 @@ def _build_request() -> MidpointHotplaceRequest:
     )
 
 
-class RecommendationServiceTests(unittest.TestCase):
-    @staticmethod
-    def _run(coro):
-        return asyncio.run(coro)
+class RecommendationServiceTests(unittest.IsolatedAsyncioTestCase):
+    def _make_service(self, kakao_local_service) -> RecommendationService:
+        # Each service owns a pooled httpx client bound to this test's loop; close it with the test.
+        service = RecommendationService(kakao_local_service=kakao_local_service)
+        self.addAsyncCleanup(service.aclose)
+        return service
 
     @staticmethod
     def _build_hotplace(
@@ -93,7 +117,7 @@ class RecommendationServiceTests(unittest.TestCase):
             naver_rating_count=rating_count,
         )
 
-    def test_midpoint_hotplaces_blocks_when_expected_calls_exceed_guard(self):
+    async def test_midpoint_hotplaces_blocks_when_expected_calls_exceed_guard(self):
         with patch.dict(
             os.environ,
             {"MAX_KAKAO_CALLS_PER_REQUEST": "50", "MIDPOINT_CACHE_TTL_SECONDS": "900"},
@@ -101,17 +125,17 @@ class RecommendationServiceTests(unittest.TestCase):
         ):
             os.environ.pop("REDIS_URL", None)
             fake = FakeKakaoLocalService()
-            service = RecommendationService(kakao_local_service=fake)
+            service = self._make_service(fake)
 
             with self.assertRaises(HTTPException) as context:
-                self._run(service.get_midpoint_hotplaces(_build_request()))
+                await service.get_midpoint_hotplaces(_build_request())
 
             self.assertEqual(context.exception.status_code, 400)
             self.assertIn("Expected Kakao API calls exceed guard", str(context.exception.detail))
             self.assertEqual(fake.station_calls, 0)
             self.assertEqual(fake.keyword_queries, [])
 
-    def test_midpoint_hotplaces_uses_all_predefined_keywords(self):
+    async def test_midpoint_hotplaces_uses_all_predefined_keywords(self):
         with patch.dict(
             os.environ,
             {"MAX_KAKAO_CALLS_PER_REQUEST": "70", "MIDPOINT_CACHE_TTL_SECONDS": "900"},
@@ -119,8 +143,8 @@ class RecommendationServiceTests(unittest.TestCase):
         ):
             os.environ.pop("REDIS_URL", None)
             fake = FakeKakaoLocalService()
-            service = RecommendationService(kakao_local_service=fake)
-            response = self._run(service.get_midpoint_hotplaces(_build_request()))
+            service = self._make_service(fake)
+            response = await service.get_midpoint_hotplaces(_build_request())
 
             self.assertEqual(response.meta.station_limit, 1)
             self.assertEqual(response.meta.pages, 1)
@@ -129,7 +153,7 @@ class RecommendationServiceTests(unittest.TestCase):
             self.assertEqual(response.meta.actual_kakao_api_call_count, 58)
             self.assertEqual(fake.station_calls, 1)
             self.assertEqual(len(fake.keyword_queries), len(PREDEFINED_PLAY_KEYWORDS))
-            self.assertTrue(all(query.startswith("강남역 ") for query in fake.keyword_queries))
+            self.assertEqual({query.split(" ", 1)[0] for query in fake.keyword_queries}, {"강남역"})
             for keyword in PREDEFINED_PLAY_KEYWORDS:
                 expected_query = f"강남역 {service._build_keyword_search_phrase(keyword)}"
                 self.assertIn(expected_query, fake.keyword_queries)
@@ -164,7 +188,7 @@ class RecommendationServiceTests(unittest.TestCase):
             "테스트 장소은 강남역 근처에서 보드게임카페를 즐기기 좋은 장소예요.",
         )
 
-    def test_midpoint_hotplaces_cache_hit_and_miss(self):
+    async def test_midpoint_hotplaces_cache_hit_and_miss(self):
         with patch.dict(
             os.environ,
             {"MAX_KAKAO_CALLS_PER_REQUEST": "70", "MIDPOINT_CACHE_TTL_SECONDS": "900"},
@@ -172,9 +196,9 @@ class RecommendationServiceTests(unittest.TestCase):
         ):
             os.environ.pop("REDIS_URL", None)
             fake = FakeKakaoLocalService()
-            service = RecommendationService(kakao_local_service=fake)
-            first = self._run(service.get_midpoint_hotplaces(_build_request()))
-            second = self._run(service.get_midpoint_hotplaces(_build_request()))
+            service = self._make_service(fake)
+            first = await service.get_midpoint_hotplaces(_build_request())
+            second = await service.get_midpoint_hotplaces(_build_request())
 
             self.assertFalse(first.meta.cache_hit)
             self.assertTrue(second.meta.cache_hit)
@@ -182,8 +206,28 @@ class RecommendationServiceTests(unittest.TestCase):
             self.assertEqual(fake.station_calls, 1)
             self.assertEqual(len(fake.keyword_queries), len(PREDEFINED_PLAY_KEYWORDS))
 
+    async def test_memory_cache_evicts_least_recently_used_entry(self):
+        with patch.dict(
+            os.environ,
+            {"MIDPOINT_CACHE_TTL_SECONDS": "900", "MIDPOINT_MEMORY_CACHE_MAX_ENTRIES": "2"},
+            clear=False,
+        ):
+            os.environ.pop("REDIS_URL", None)
+            service = self._make_service(FakeKakaoLocalService())
+            response = await service.get_midpoint_hotplaces(_build_request())
+
+            await service._set_cached_response("key-a", response)
+            await service._set_cached_response("key-b", response)
+            await service._get_cached_response("key-a")
+            await service._set_cached_response("key-c", response)
+            cached_flags = [
+                (await service._get_cached_response(key))[0] is not None
+                for key in ("key-a", "key-b", "key-c")
+            ]
+            self.assertEqual(cached_flags, [True, False, True])
+
     def test_extract_rating_summary_from_feature_payload(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         rating, rating_count = service._extract_rating_summary_from_feature_payload(
             {
                 "naver_rating_summary": {
@@ -196,19 +240,19 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertEqual(rating_count, 1289)
 
     def test_extract_activity_intro_from_feature_payload(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         intro = service._extract_activity_intro_from_feature_payload(
             {"place_intro": "  강남역 근처에서 가볍게 즐기기 좋아요.  "}
         )
         self.assertEqual(intro, "강남역 근처에서 가볍게 즐기기 좋아요.")
 
     def test_extract_activity_intro_from_feature_payload_rejects_invalid_value(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         intro = service._extract_activity_intro_from_feature_payload({"place_intro": {"text": "invalid"}})
         self.assertIsNone(intro)
 
     def test_extract_photo_collection_status_marks_failed_on_mapping_reason(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         status_value, reason = service._extract_photo_collection_status_from_feature_payload(
             {"naver_mapping": {"reason": "no_candidates"}},
             has_photo=False,
@@ -218,7 +262,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertEqual(reason, "no_candidates")
 
     def test_extract_photo_collection_status_marks_empty_when_crawled_without_photos(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         status_value, reason = service._extract_photo_collection_status_from_feature_payload(
             {},
             has_photo=False,
@@ -227,7 +271,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertEqual(status_value, "EMPTY")
         self.assertIsNone(reason)
 
-    def test_midpoint_hotplaces_fails_entire_request_on_single_keyword_error(self):
+    async def test_midpoint_hotplaces_fails_entire_request_on_single_keyword_error(self):
         with patch.dict(
             os.environ,
             {
@@ -239,16 +283,50 @@ class RecommendationServiceTests(unittest.TestCase):
         ):
             os.environ.pop("REDIS_URL", None)
             fake = FakeKakaoLocalService(fail_keyword="볼링장")
-            service = RecommendationService(kakao_local_service=fake)
+            service = self._make_service(fake)
 
             with self.assertRaises(HTTPException) as context:
-                self._run(service.get_midpoint_hotplaces(_build_request()))
+                await service.get_midpoint_hotplaces(_build_request())
 
             self.assertEqual(context.exception.status_code, 503)
             self.assertIn("all-or-nothing policy", str(context.exception.detail))
             self.assertEqual(fake.station_calls, 1)
 
-    def test_midpoint_hotplaces_response_unchanged_when_ingestion_enqueue_fails(self):
+    async def test_midpoint_hotplaces_cancels_pending_keywords_on_first_failure(self):
+        class SlowFakeKakaoLocalService(FakeKakaoLocalService):
+            def __init__(self) -> None:
+                super().__init__(fail_keyword="볼링장")
+                self.cancelled_queries: list[str] = []
+
+            async def search_places_by_keyword(self, *, query: str, **kwargs):
+                if not query.endswith(f" {self.fail_keyword}"):
+                    try:
+                        await asyncio.sleep(10)
+                    except asyncio.CancelledError:
+                        self.cancelled_queries.append(query)
+                        raise
+                return await super().search_places_by_keyword(query=query, **kwargs)
+
+        with patch.dict(
+            os.environ,
+            {
+                "MAX_KAKAO_CALLS_PER_REQUEST": "70",
+                "MIDPOINT_CACHE_TTL_SECONDS": "900",
+                "MIDPOINT_KEYWORD_CONCURRENCY": "64",
+            },
+            clear=False,
+        ):
+            os.environ.pop("REDIS_URL", None)
+            fake = SlowFakeKakaoLocalService()
+            service = self._make_service(fake)
+
+            with self.assertRaises(HTTPException) as context:
+                await service.get_midpoint_hotplaces(_build_request())
+
+            self.assertEqual(context.exception.status_code, 503)
+            self.assertEqual(len(fake.cancelled_queries), len(PREDEFINED_PLAY_KEYWORDS) - 1)
+
+    async def test_midpoint_hotplaces_response_unchanged_when_ingestion_enqueue_fails(self):
         with patch.dict(
             os.environ,
             {
@@ -260,20 +338,20 @@ class RecommendationServiceTests(unittest.TestCase):
         ):
             os.environ.pop("REDIS_URL", None)
             fake = FakeKakaoLocalService()
-            service = RecommendationService(kakao_local_service=fake)
+            service = self._make_service(fake)
 
             with patch(
                 "app.services.recommendation_service.create_ingestion_job_from_hotplaces",
                 new=AsyncMock(side_effect=RuntimeError("enqueue failed")),
             ) as mock_enqueue:
-                response = self._run(service.get_midpoint_hotplaces(_build_request()))
+                response = await service.get_midpoint_hotplaces(_build_request())
 
             self.assertGreater(response.meta.hotplace_count, 0)
             self.assertEqual(response.meta.actual_kakao_api_call_count, 58)
             mock_enqueue.assert_awaited_once()
 
     def test_rank_hotplaces_prefers_indoor_category_for_rainy_weather(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         request = MidpointHotplaceRequest(
             participants=[
                 {"lat": 37.5000, "lng": 127.0000},
@@ -306,7 +384,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertGreater(ranked[0].ranking_score, ranked[1].ranking_score)
 
     def test_rank_hotplaces_prefers_outdoor_friendly_category_for_clear_weather(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         request = MidpointHotplaceRequest(
             participants=[
                 {"lat": 37.5000, "lng": 127.0000},
@@ -339,7 +417,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertGreater(ranked[0].ranking_score, ranked[1].ranking_score)
 
     def test_rank_hotplaces_boosts_high_review_count_over_rating_gap(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         request = MidpointHotplaceRequest(
             participants=[
                 {"lat": 37.5000, "lng": 127.0000},
@@ -370,7 +448,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertGreater(ranked[0].ranking_score, ranked[1].ranking_score)
 
     def test_rank_hotplaces_allows_zero_rating_when_review_count_is_high(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         request = MidpointHotplaceRequest(
             participants=[
                 {"lat": 37.5000, "lng": 127.0000},
@@ -401,7 +479,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertEqual(len(ranked), 2)
 
     def test_cache_key_changes_when_weather_key_changes(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         base_request = _build_request()
         rainy_request = base_request.model_copy(update={"weather_key": "비"})
 
@@ -411,7 +489,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertNotEqual(base_key, rainy_key)
 
     def test_build_hotplace_filters_out_interior_related_places(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         excluded = service._build_hotplace(
             {
                 "id": "interior-1",
@@ -451,7 +529,7 @@ class RecommendationServiceTests(unittest.TestCase):
         self.assertIsNotNone(kept)
 
     def test_should_hide_hotplace_for_mapping_issue(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+        service = self._make_service(FakeKakaoLocalService())
         self.assertTrue(
             service._should_hide_hotplace_for_mapping_issue(
                 {"mapping_issue_reason": "low_confidence"}
@@ -468,8 +546,8 @@ class RecommendationServiceTests(unittest.TestCase):
             )
         )
 
-    def test_attach_hotplace_features_filters_mapping_issue_places(self):
-        service = RecommendationService(kakao_local_service=FakeKakaoLocalService())
+    async def test_attach_hotplace_features_filters_mapping_issue_places(self):
+        service = self._make_service(FakeKakaoLocalService())
         target = MidpointHotplace(
             kakao_place_id="place-1",
             place_name="테스트 장소",
@@ -491,10 +569,25 @@ class RecommendationServiceTests(unittest.TestCase):
                 }
             ),
         ):
-            result = self._run(service._attach_hotplace_features([target], session=object()))
+            result = await service._attach_hotplace_features([target], session=object())
 
         self.assertEqual(result, [])
 
+    async def test_aclose_closes_shared_kakao_client_and_next_get_client_rebuilds(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("REDIS_URL", None)
+            service = self._make_service(KakaoLocalService())
+
+        client = service.kakao_local_service.get_client()
+        self.assertIs(service.kakao_local_service.get_client(), client)
+
+        await service.aclose()
+        self.assertTrue(client.is_closed)
+
+        fresh = service.kakao_local_service.get_client()
+        self.assertIsNot(fresh, client)
+        self.assertFalse(fresh.is_closed)
+
 
 if __name__ == "__main__":
     unittest.main()
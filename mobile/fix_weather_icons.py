@@ -1,30 +1,35 @@
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 import os
+import shutil
+
+from PIL import Image, ImageChops
+
+# 256-entry lookup tables so the grid test runs inside PIL instead of a per-pixel Python loop.
+LOW_SATURATION_LUT = [255 if v < 10 else 0 for v in range(256)]
+BRIGHT_LUT = [255 if v > 180 else 0 for v in range(256)]
+
+def build_grid_mask(img):
+    # Grid pixels are near-neutral light gray/white (e.g., around 204/204/204 or 255/255/255):
+    # low HSV saturation and high value, as an "L" mask (255 = grid).
+    _, saturation, value = img.convert("RGB").convert("HSV").split()
+    return ImageChops.multiply(saturation.point(LOW_SATURATION_LUT), value.point(BRIGHT_LUT))
 
 def fix_background(input_path, output_path, target_bg_color=(255, 240, 243)): # #fff0f3
     img = Image.open(input_path).convert("RGBA")
-    datas = img.getdata()
 
-    new_data = []
-    # Grid colors are usually gray and white. 
+    # Grid colors are usually gray and white.
     # Let's target pixels that are very close to white or mid-gray
     # and replace them with the target background color.
     # Note: This is an approximation. If the icon itself has these colors, it might get affected.
-    # But since it's a grid, we can also check for patterns or just use a threshold.
-    
-    for item in datas:
-        r, g, b, a = item
-        # Grayish grid color check (e.g., around 204/204/204 or white 255/255/255)
-        # We assume the icon itself doesn't have exactly these alternating gray/white colors at the edges.
-        is_grid = (abs(r - g) < 5 and abs(g - b) < 5 and r > 180) # Very simple threshold for gray/white
-        
-        if is_grid:
-            new_data.append(target_bg_color + (255,))
-        else:
-            new_data.append(item)
-
-    img.putdata(new_data)
-    img.save(output_path, "PNG")
+    # We assume the icon itself doesn't have exactly these alternating gray/white colors at the edges.
+    mask = build_grid_mask(img)
+    if mask.getbbox() is None:
+        # No grid pixels at all: nothing to repaint, so skip the PNG re-encode.
+        shutil.copyfile(input_path, output_path)
+        return
+
+    background = Image.new("RGBA", img.size, target_bg_color + (255,))
+    Image.composite(background, img, mask).save(output_path, "PNG")
 
 # Path to original uploads
 brain_path = "C:/Users/selen/.gemini/antigravity/brain/44ca05af-7882-4f69-8ee7-f7c00720f8e7"
@@ -35,10 +40,19 @@ uploads = [
     ("uploaded_media_3_1770008545585.png", "sun.png")
 ]
 
-os.makedirs("assets/weather", exist_ok=True)
+OUTPUT_DIR = "assets/weather"
 
-for original, target in uploads:
+def _process(pair):
+    original, target = pair
     input_file = os.path.join(brain_path, original)
-    output_file = os.path.join("assets/weather", target)
+    output_file = os.path.join(OUTPUT_DIR, target)
     print(f"Processing {original} -> {target}")
     fix_background(input_file, output_file)
+
+if __name__ == "__main__":
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Each icon is independent CPU-bound work (decode + mask + PNG encode), so fan out across processes.
+    max_workers = min(len(uploads), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_process, uploads))
@@ -1,31 +1,71 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class InstagramTrend:
+    kakao_place_id: str
+    place_name: str | None
+    post_freq_7d: float
+    post_freq_30d: float
+    count_7d: int
+    count_30d: int
+    sampled_at: str
+    raw_payload: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dict form for persistence boundaries (Mongo raw docs, feature_payload JSON)."""
+        return {
+            "kakao_place_id": self.kakao_place_id,
+            "place_name": self.place_name,
+            "post_freq_7d": self.post_freq_7d,
+            "post_freq_30d": self.post_freq_30d,
+            "count_7d": self.count_7d,
+            "count_30d": self.count_30d,
+            "sampled_at": self.sampled_at,
+            "raw_payload": dict(self.raw_payload),
+        }
 
 
 def _stable_seed(kakao_place_id: str) -> int:
     return sum(ord(char) for char in kakao_place_id)
 
 
-def crawl_instagram_trend(kakao_place_id: str, place_name: str | None) -> dict:
+def _rounded_rate(count: int, days: int) -> float:
+    """count / days rounded half-up to 4 decimals, computed in fixed point."""
+    return ((count * 20000 + days) // (days * 2)) / 10000
+
+
+@lru_cache(maxsize=10_000)
+def _compute_metrics(kakao_place_id: str) -> tuple[float, float, int, int, int]:
+    """(post_freq_7d, post_freq_30d, count_7d, count_30d, seed); deterministic per place id."""
+    seed = _stable_seed(kakao_place_id)
+    count_7d = (seed % 40) + 10
+    count_30d = (seed % 120) + 30
+    return _rounded_rate(count_7d, 7), _rounded_rate(count_30d, 30), count_7d, count_30d, seed
+
+
+def crawl_instagram_trend(kakao_place_id: str, place_name: str | None) -> InstagramTrend:
     """Placeholder adapter returning deterministic trend metrics."""
     # TODO: Replace with real Instagram trend ingestion.
     # - Integrate authenticated API or legal scraping path.
     # - Add hashtag/location query planner and sampling strategy.
     # - Implement per-keyword and per-account rate-limit controls.
-    seed = _stable_seed(kakao_place_id)
-    freq_7d = float((seed % 40) + 10) / 7.0
-    freq_30d = float((seed % 120) + 30) / 30.0
-
-    return {
-        "kakao_place_id": kakao_place_id,
-        "place_name": place_name,
-        "post_freq_7d": round(freq_7d, 4),
-        "post_freq_30d": round(freq_30d, 4),
-        "count_7d": int(round(freq_7d * 7)),
-        "count_30d": int(round(freq_30d * 30)),
-        "sampled_at": datetime.utcnow().isoformat(),
-        "raw_payload": {
+    post_freq_7d, post_freq_30d, count_7d, count_30d, seed = _compute_metrics(kakao_place_id)
+
+    return InstagramTrend(
+        kakao_place_id=kakao_place_id,
+        place_name=place_name,
+        post_freq_7d=post_freq_7d,
+        post_freq_30d=post_freq_30d,
+        count_7d=count_7d,
+        count_30d=count_30d,
+        sampled_at=datetime.utcnow().isoformat(),
+        raw_payload={
             "source": "placeholder",
             "seed": seed,
             "notes": "Deterministic placeholder metric",
         },
-    }
+    )
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import copy
 import hashlib
+import heapq
+import json
 import logging
 import os
 import random
 import re
+import threading
 import time
-from dataclasses import dataclass
+import warnings
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
 from math import asin, cos, radians, sin, sqrt
-from typing import Any, Callable
-from urllib.parse import parse_qs, quote_plus, unquote, urljoin, urlparse
+from operator import itemgetter
+from typing import Any, Callable, Iterable
+from urllib.parse import quote_plus, unquote, unquote_plus, urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from playwright.sync_api import (
@@ -29,9 +43,188 @@ except Exception:  # pragma: no cover - runtime fallback for environments withou
     PlaywrightTimeoutError = TimeoutError  # type: ignore[assignment]
     sync_playwright = None  # type: ignore[assignment]
 
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+except Exception:  # pragma: no cover - falls back to difflib when rapidfuzz is unavailable.
+    rapidfuzz_fuzz = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - falls back to response.json() when orjson is unavailable.
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import redis
+except Exception:  # pragma: no cover - mapping cache stays process-local without redis-py.
+    redis = None  # type: ignore[assignment]
+
+try:
+    import re2 as _re2
+except Exception:  # pragma: no cover - rating pair patterns stay on the stdlib re engine.
+    _re2 = None  # type: ignore[assignment]
+
 logger = logging.getLogger("worker.naver_place")
 
 MAP_MIN_CONFIDENCE = 0.50
+MAPPING_TOP_CANDIDATE_LIMIT = 3
+# A probe that already yielded a near-exact name hit ends the search; each extra mapping
+# URL is a full page load. The whole probe is kept, so chain branches on it still compete.
+MAPPING_EARLY_EXIT_NAME_SCORE = 0.92
+ROUTE_COORD_ANCHOR_LIMIT = 120
+ROUTE_COORD_HREFS_SCRIPT = (
+    "(limit) => Array.from(document.querySelectorAll(\"a[href*='nso_path']\"))"
+    ".slice(0, limit).map((el) => el.getAttribute('href'))"
+)
+# DOM harvesting runs inside the page via locator.evaluate_all() so a whole result list
+# crosses the CDP channel in one round-trip instead of an nth()/inner_text() RPC per field.
+# firstText takes the first matching descendant with non-empty text, else the element's own
+# text; firstAttr takes the first non-empty attribute.
+_DOM_HELPERS_JS = """
+const clean = (value) => (value || '').trim().replace(/\\s+/g, ' ');
+const firstText = (root, selectors) => {
+  for (const selector of selectors) {
+    const nested = root.querySelector(selector);
+    if (!nested) continue;
+    const text = clean(nested.innerText);
+    if (text) return text;
+  }
+  return clean(root.innerText) || null;
+};
+const firstAttr = (el, names) => {
+  for (const name of names) {
+    const value = el.getAttribute(name);
+    if (value) return value.trim();
+  }
+  return null;
+};
+"""
+REVIEW_ITEMS_SCRIPT = (
+    "(elements, [limit, contentSelectors, authorSelectors, dateSelectors]) => {"
+    + _DOM_HELPERS_JS
+    + """
+  // Items _extract_reviews would reject (empty or under two code points once "더보기" is
+  // removed) are dropped here so they never cross CDP; kept content is returned raw and
+  // cleaned once in Python.
+  return elements.slice(0, limit).map((el) => {
+    const content = firstText(el, contentSelectors);
+    if ([...(content || '').split('더보기').join('').trim()].length < 2) return null;
+    return {
+      review_id: firstAttr(el, ['data-review-id', 'data-id', 'id']),
+      content,
+      author: firstText(el, authorSelectors),
+      posted_at: firstText(el, dateSelectors),
+    };
+  }).filter(Boolean);
+}"""
+)
+PHOTO_ITEMS_SCRIPT = (
+    "(elements, limit) => {"
+    + _DOM_HELPERS_JS
+    + """
+  // Lazy-load placeholders (data: URIs) are skipped in the page as well.
+  return elements.slice(0, limit).map((el) => {
+    const image_url = firstAttr(el, ['src', 'data-src', 'data-original', 'data-lazy-src', 'data-image-src']);
+    if (!image_url || image_url.startsWith('data:')) return null;
+    return { image_url, alt: firstAttr(el, ['alt']), title: firstAttr(el, ['title']) };
+  }).filter(Boolean);
+}"""
+)
+# 'start' rather than 'end' so whatever sits below the last item (the loader sentinel)
+# is inside the viewport too.
+PHOTO_JUMP_SCRIPT = """(selector) => {
+  const items = document.querySelectorAll(selector);
+  const last = items[items.length - 1];
+  if (last) last.scrollIntoView({ block: 'start' });
+  return items.length;
+}"""
+COUNT_INCREASE_SCRIPT = "([selector, previous]) => document.querySelectorAll(selector).length > previous"
+# Item count, last src and pending lazy placeholders: if none moved, a re-extract finds nothing new.
+PHOTO_GRID_SIGNATURE_SCRIPT = """(selector) => {
+  const items = Array.from(document.querySelectorAll(selector));
+  const last = items[items.length - 1];
+  const placeholders = items.filter((el) => (el.getAttribute('src') || '').startsWith('data:')).length;
+  return [items.length, last ? last.getAttribute('src') || '' : '', placeholders];
+}"""
+# Mirrors _clean_candidate_name/_is_noisy_candidate_name so noisy anchors never cross CDP;
+# the noise regex is passed in from NOISY_MAPPING_NAME_UNION rather than duplicated here.
+MAPPING_ANCHORS_SCRIPT = (
+    "(elements, [limit, noisePattern]) => {"
+    + _DOM_HELPERS_JS
+    + """
+  const noisy = new RegExp(noisePattern, 'i');
+  const candidateName = (el) => {
+    const raw = firstText(el, ['span', 'strong', 'em'])
+      || (el.getAttribute('title') || el.getAttribute('aria-label') || '');
+    return clean(clean(raw).split(',', 1)[0]);
+  };
+  const isNoisy = (name) => {
+    const compact = name.replace(/ /g, '');
+    return [...compact].length < 2 || /^\\p{Nd}+$/u.test(compact) || noisy.test(name);
+  };
+  const results = [];
+  for (const el of elements.slice(0, limit)) {
+    const href = firstAttr(el, ['href']);
+    if (!href) continue;
+    const name = candidateName(el);
+    if (isNoisy(name)) continue;
+    results.push({
+      href,
+      name,
+      snippet: clean((el.closest('li,article,section,div') || el.parentElement)?.innerText).slice(0, 180),
+    });
+  }
+  return results;
+}"""
+)
+# Thin-page probe: the interactive-element query only runs when the document is small.
+CONTENT_PAGE_STATS_SCRIPT = """() => {
+  const htmlLen = document.documentElement.outerHTML.length;
+  if (htmlLen >= 10000) return { html_len: htmlLen, interactive_count: -1 };
+  return { html_len: htmlLen, interactive_count: document.querySelectorAll('a, button, img').length };
+}"""
+# Body text plus only the slices of outerHTML around rating JSON keys (the embedded state
+# blob is most of a place page's HTML). Slices start just before a key and are long enough
+# for the score/count pair patterns; overlapping slices merge, and the separator is wider
+# than the pair patterns' 240-char gap so no match can straddle two slices.
+PAGE_TEXT_AND_RATING_HTML_SCRIPT = """([keyPattern, after, maxSlices]) => {
+  const text = document.body ? document.body.innerText : '';
+  const html = document.documentElement.outerHTML;
+  const keys = new RegExp(keyPattern, 'gi');
+  const slices = [];
+  let match;
+  while ((match = keys.exec(html)) !== null && slices.length <= maxSlices) {
+    const start = Math.max(0, match.index - 1);
+    const end = Math.min(html.length, match.index + after);
+    const last = slices[slices.length - 1];
+    if (last && start <= last[1]) last[1] = Math.max(last[1], end);
+    else slices.push([start, end]);
+  }
+  return [text, slices.slice(0, maxSlices).map(([s, e]) => html.slice(s, e)).join(' '.repeat(256))];
+}"""
+RATING_HTML_SLICE_CHARS = 480
+RATING_HTML_MAX_SLICES = 200
+# Bytes the crawler never reads: images (only their src attributes matter), fonts and media.
+# Stylesheets stay enabled because innerText and click visibility depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Analytics and ad beacons are aborted whatever their resource type; page scripts never
+# wait on them.
+BLOCKED_TRACKER_URL_PATTERN = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|wcs\.naver\.(?:com|net)",
+    re.IGNORECASE,
+)
+BLOCKED_RESOURCE_URL_PATTERN = re.compile(
+    r"\.(?:png|jpe?g|gif|webp|avif|bmp|ico|svg|woff2?|ttf|otf|eot|mp4|webm|m3u8|mp3)(?:[?#]|$)"
+    r"|search\.pstatic\.net/common|phinf\.pstatic\.net/|"
+    + BLOCKED_TRACKER_URL_PATTERN.pattern,
+    re.IGNORECASE,
+)
+# XHR endpoints behind the search pages that return place lists as JSON.
+MAPPING_JSON_URL_MARKERS = (
+    "map.naver.com/p/api/search",
+    "place/list",
+    "restaurant/list",
+    "search.map.naver.com",
+)
 MAX_RETRY_ATTEMPTS = 3
 KAKAO_KEYWORD_SEARCH_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
 
@@ -78,6 +271,8 @@ REVIEW_ITEM_SELECTORS = [
     "li:has(time)",
 ]
 
+REVIEW_ITEMS_SELECTOR = ", ".join(REVIEW_ITEM_SELECTORS)
+
 REVIEW_CONTENT_SELECTORS = [
     "span[class*='review']",
     "div[class*='review']",
@@ -107,6 +302,9 @@ PHOTO_ITEM_SELECTORS = [
     "figure img[src]",
 ]
 
+# Selector list for in-page querySelectorAll, where only the union of matches matters.
+PHOTO_ITEMS_SELECTOR = ", ".join(PHOTO_ITEM_SELECTORS)
+
 PHOTO_DATE_SELECTORS = [
     "time",
     "span[class*='date']",
@@ -132,6 +330,11 @@ NOISY_MAPPING_NAME_PATTERNS = [
     re.compile(r"운영\s*중", re.IGNORECASE),
     re.compile(r"운영\s*종료", re.IGNORECASE),
 ]
+# Any-match only, so one alternation scan is equivalent to searching each pattern.
+NOISY_MAPPING_NAME_UNION = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in NOISY_MAPPING_NAME_PATTERNS),
+    re.IGNORECASE,
+)
 
 RATING_SCORE_TEXT_PATTERNS = [
     re.compile(r"(?:별점|평점)\s*([0-5](?:[.,]\d{1,2})?)"),
@@ -156,6 +359,24 @@ RATING_SCORE_COUNT_HTML_PATTERNS = [
     ),
 ]
 
+
+def _compile_linear(pattern: re.Pattern[str]) -> Any:
+    """Recompile ``pattern`` on RE2 when google-re2 is installed.
+
+    RE2 matches in linear time, so the lazy ``[\\s\\S]{0,240}?`` gaps in the pair
+    patterns cannot backtrack on large payloads. Only ``re.IGNORECASE`` is carried over.
+    """
+    if _re2 is None:
+        return pattern
+    prefix = "(?i)" if pattern.flags & re.IGNORECASE else ""
+    try:
+        return _re2.compile(prefix + pattern.pattern)
+    except Exception:  # pragma: no cover - keep the stdlib pattern if RE2 rejects the syntax.
+        return pattern
+
+
+RATING_SCORE_COUNT_HTML_SCANNERS = [_compile_linear(pattern) for pattern in RATING_SCORE_COUNT_HTML_PATTERNS]
+
 RATING_SCORE_HTML_PATTERNS = [
     re.compile(r'"(?:visitorReviewScore|starScore|averageRating|ratingScore)"\s*:\s*"?([0-5](?:\.\d{1,3})?)"?', re.IGNORECASE),
     re.compile(r'"visitorReviewsScore"\s*:\s*"?([0-5](?:\.\d{1,3})?)"?', re.IGNORECASE),
@@ -167,9 +388,93 @@ RATING_COUNT_HTML_PATTERNS = [
     re.compile(r'"visitorReviewsTotal"\s*:\s*"?([0-9][0-9,]*)"?', re.IGNORECASE),
 ]
 
-NAVER_ROUTE_CODE_PATTERN = re.compile(r"(?:^|[;|])code\^([^;|]+)")
-NAVER_ROUTE_LNG_PATTERN = re.compile(r"(?:^|[;|])longitude\^([0-9.+-]+)")
-NAVER_ROUTE_LAT_PATTERN = re.compile(r"(?:^|[;|])latitude\^([0-9.+-]+)")
+
+class _PatternUnion:
+    """Scan text once for a priority-ordered pattern family.
+
+    Each pattern is wrapped in a lookahead so overlapping matches from different
+    patterns are all visible, and the result matches looping ``pattern.search`` in
+    order and taking the first match whose value parses.
+    """
+
+    def __init__(
+        self,
+        patterns: list[re.Pattern[str]],
+        sentinels: tuple[str, ...] = (),
+    ) -> None:
+        self.patterns = patterns
+        # Literal substrings at least one of which every pattern needs; a plain `in`
+        # check skips the regex scan entirely on pages without any of them.
+        self.sentinels = sentinels
+        self._group_to_index: dict[int, int] = {}
+        parts: list[str] = []
+        group_number = 1
+        for index, pattern in enumerate(patterns):
+            parts.append(f"(?=({pattern.pattern}))")
+            self._group_to_index[group_number] = index
+            group_number += 1 + pattern.groups
+        self.union = re.compile("|".join(parts), patterns[0].flags if patterns else 0)
+
+    def first_parsed(self, text: str, parser: Callable[[str | None], Any]) -> Any:
+        if not text:
+            return None
+        if self.sentinels and not any(sentinel in text for sentinel in self.sentinels):
+            return None
+
+        first_values: dict[int, str | None] = {}
+        for match in self.union.finditer(text):
+            index = self._group_to_index[match.lastindex]
+            if index in first_values:
+                continue
+            first_values[index] = match.group(match.lastindex + 1)
+            if index == 0:
+                break
+
+        for index in range(len(self.patterns)):
+            if index not in first_values:
+                continue
+            parsed = parser(first_values[index])
+            if parsed is not None:
+                return parsed
+            # A lower-priority match may be hidden behind this one at the same offset;
+            # resolve the rest with plain per-pattern searches.
+            for pattern in self.patterns[index + 1 :]:
+                match = pattern.search(text)
+                if not match:
+                    continue
+                parsed = parser(match.group(1))
+                if parsed is not None:
+                    return parsed
+            return None
+        return None
+
+
+# HTML sentinels assume Naver's camelCase JSON keys, even though the patterns are case-insensitive.
+# One key per pair pattern, in the same order: a pair pattern cannot match without its
+# own score key, so each is scanned only when that key is present.
+RATING_SCORE_COUNT_HTML_SENTINELS = ("visitorReviewsScore", "avgRating")
+RATING_HTML_SENTINELS = (
+    "visitorReview",
+    "avgRating",
+    "starScore",
+    "starCount",
+    "averageRating",
+    "ratingScore",
+    "ratingCount",
+)
+
+RATING_SCORE_TEXT_UNION = _PatternUnion(RATING_SCORE_TEXT_PATTERNS, sentinels=("점", "/5"))
+RATING_COUNT_TEXT_UNION = _PatternUnion(RATING_COUNT_TEXT_PATTERNS, sentinels=("명", "평점"))
+# HTML unions are gated once on RATING_HTML_SENTINELS in _parse_naver_rating_summary.
+RATING_SCORE_HTML_UNION = _PatternUnion(RATING_SCORE_HTML_PATTERNS)
+RATING_COUNT_HTML_UNION = _PatternUnion(RATING_COUNT_HTML_PATTERNS)
+
+PLACE_ID_UNION = _PatternUnion(PLACE_ID_PATTERNS, sentinels=("place", "restaurant"))
+
+NAVER_NSO_PATH_QUERY_PATTERN = re.compile(r"[?&]nso_path=([^&#]*)")
+NAVER_ROUTE_FIELDS_PATTERN = re.compile(
+    r"(?:^|[;|])(?:code\^(?P<code>[^;|]+)|longitude\^(?P<lng>[0-9.+-]+)|latitude\^(?P<lat>[0-9.+-]+))"
+)
 
 
 @dataclass(frozen=True)
@@ -185,6 +490,16 @@ class NaverCrawlerConfig:
     kakao_lookup_radius_m: int
     kakao_lookup_size: int
     kakao_lookup_timeout_sec: float
+    browser_reuse: bool = True
+    kakao_lookup_concurrency: int = 8
+    photo_prefetch: bool = True
+    block_heavy_resources: bool = True
+    bundle_concurrency: int = 2
+    bundle_max_concurrency: int = 2
+    browser_max_uses: int = 200
+    browser_max_age_sec: float = 1800.0
+    browser_cdp_endpoint: str | None = None
+    mapping_cache_ttl_sec: int = 21600
 
 
 @dataclass
@@ -193,6 +508,7 @@ class BrowserSession:
     browser: Browser
     context: BrowserContext
     page: Page
+    pool: _BrowserPool | None = None
 
 
 class _NoGrowthGuard:
@@ -209,6 +525,15 @@ class _NoGrowthGuard:
         self.streak += 1
         return self.streak >= self.limit
 
+    def observe_delta(self, added: int) -> bool:
+        """Same as ``observe(last_count + added)`` for callers that already know the growth."""
+        if added > 0:
+            self.last_count += added
+            self.streak = 0
+            return False
+        self.streak += 1
+        return self.streak >= self.limit
+
 
 def _get_bool_env(name: str, default: bool) -> bool:
     raw = os.getenv(name)
@@ -260,13 +585,42 @@ def _load_config() -> NaverCrawlerConfig:
         kakao_lookup_radius_m=_get_int_env("NAVER_KAKAO_LOOKUP_RADIUS_M", 1200),
         kakao_lookup_size=_get_int_env("NAVER_KAKAO_LOOKUP_SIZE", 5),
         kakao_lookup_timeout_sec=_get_float_env("NAVER_KAKAO_LOOKUP_TIMEOUT_SEC", 1.8, minimum=0.2),
+        browser_reuse=_get_bool_env("NAVER_BROWSER_REUSE", True),
+        kakao_lookup_concurrency=_get_int_env("NAVER_KAKAO_LOOKUP_CONCURRENCY", 8),
+        photo_prefetch=_get_bool_env("NAVER_PHOTO_PREFETCH", True),
+        block_heavy_resources=_get_bool_env("NAVER_BLOCK_HEAVY_RESOURCES", True),
+        bundle_concurrency=_get_int_env("NAVER_BUNDLE_CONCURRENCY", 2),
+        bundle_max_concurrency=_get_int_env("NAVER_BUNDLE_MAX_CONCURRENCY", 2),
+        browser_max_uses=_get_int_env("NAVER_BROWSER_MAX_USES", 200),
+        browser_max_age_sec=_get_float_env("NAVER_BROWSER_MAX_AGE_SEC", 1800.0, minimum=1.0),
+        browser_cdp_endpoint=(os.getenv("NAVER_BROWSER_CDP_ENDPOINT") or "").strip() or None,
+        mapping_cache_ttl_sec=_get_int_env("NAVER_MAPPING_CACHE_TTL_SEC", 21600, minimum=0),
     )
 
 
+class _NonWordTranslation(dict):
+    """str.translate table equivalent to NON_WORD_PATTERN.sub, filled lazily per code point."""
+
+    def __init__(self, replacement: int | None) -> None:
+        super().__init__()
+        self.replacement = replacement
+
+    def __missing__(self, codepoint: int) -> int | None:
+        mapped = self.replacement if NON_WORD_PATTERN.match(chr(codepoint)) else codepoint
+        self[codepoint] = mapped
+        return mapped
+
+
+NON_WORD_TO_SPACE = _NonWordTranslation(ord(" "))
+NON_WORD_REMOVE = _NonWordTranslation(None)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_text(value: str | None) -> str:
     if not value:
         return ""
-    cleaned = NON_WORD_PATTERN.sub(" ", value.lower())
+    # Runs collapse in the split/join below, so a per-character space matches sub(" ").
+    cleaned = value.lower().translate(NON_WORD_TO_SPACE)
     return " ".join(cleaned.split())
 
 
@@ -294,24 +648,69 @@ def _is_noisy_candidate_name(value: str | None) -> bool:
     if compact.isdigit():
         return True
 
-    for pattern in NOISY_MAPPING_NAME_PATTERNS:
-        if pattern.search(text):
-            return True
-    return False
+    return NOISY_MAPPING_NAME_UNION.search(text) is not None
+
 
+# A/B switch: score compact names with char/3-gram Jaccard instead of an edit-distance ratio.
+# Toggle at runtime by assigning the flag and calling _clear_name_caches().
+NAME_RATIO_USE_JACCARD = _get_bool_env("NAVER_NAME_RATIO_JACCARD", False)
 
+
+def _jaccard_ratio(left: str, right: str) -> float:
+    if not left or not right:
+        return 0.0
+    left_chars = Counter(left)
+    right_chars = Counter(right)
+    char_jaccard = sum((left_chars & right_chars).values()) / sum((left_chars | right_chars).values())
+
+    left_grams = {left[index : index + 3] for index in range(len(left) - 2)}
+    right_grams = {right[index : index + 3] for index in range(len(right) - 2)}
+    if not left_grams or not right_grams:
+        # Names under three characters carry no trigrams; rely on the character overlap.
+        return char_jaccard
+    ngram_jaccard = len(left_grams & right_grams) / len(left_grams | right_grams)
+    return 0.6 * char_jaccard + 0.4 * ngram_jaccard
+
+
+@lru_cache(maxsize=8192)
+def _sequence_ratio(left: str, right: str) -> float:
+    if NAME_RATIO_USE_JACCARD:
+        return _jaccard_ratio(left, right)
+    if rapidfuzz_fuzz is not None:
+        # C++ Indel ratio (2*LCS/total); tracks SequenceMatcher.ratio() closely on short names.
+        return rapidfuzz_fuzz.ratio(left, right) / 100.0
+    return SequenceMatcher(None, left, right).ratio()
+
+
+@lru_cache(maxsize=8192)
+def _prepare_name(value: str | None) -> tuple[str, str, frozenset[str]]:
+    """(normalized, compact, token set) derivations shared by every comparison of a name."""
+    normalized = _normalize_text(value)
+    return normalized, normalized.replace(" ", ""), frozenset(normalized.split())
+
+
+def _clear_name_caches() -> None:
+    # Only for the Jaccard toggle and tests: the caches are process-wide and shared by
+    # concurrent batch threads, so the LRU bounds, not session lifetimes, keep them small.
+    _normalize_text.cache_clear()
+    _prepare_name.cache_clear()
+    _sequence_ratio.cache_clear()
+    _name_similarity.cache_clear()
+
+
+# The same (query name, candidate name) pair is scored by candidate tie-breaks, the
+# mapping scorer and the Kakao document picker; cache the whole blended score.
+@lru_cache(maxsize=8192)
 def _name_similarity(left: str | None, right: str | None) -> float:
-    left_norm = _normalize_text(left)
-    right_norm = _normalize_text(right)
+    left_norm, left_compact, left_tokens = _prepare_name(left)
+    right_norm, right_compact, right_tokens = _prepare_name(right)
     if not left_norm or not right_norm:
         return 0.0
+    if left_norm == right_norm:
+        # Identical names score exactly 1.0 under every ratio engine; skip the comparison.
+        return 1.0
 
-    left_compact = left_norm.replace(" ", "")
-    right_compact = right_norm.replace(" ", "")
-
-    ratio_score = SequenceMatcher(None, left_compact, right_compact).ratio()
-    left_tokens = set(left_norm.split())
-    right_tokens = set(right_norm.split())
+    ratio_score = 1.0 if left_compact == right_compact else _sequence_ratio(left_compact, right_compact)
     token_overlap = 0.0
     if left_tokens and right_tokens:
         token_overlap = len(left_tokens & right_tokens) / max(len(left_tokens), len(right_tokens))
@@ -323,7 +722,10 @@ def _name_similarity(left: str | None, right: str | None) -> float:
 
 
 def _to_optional_float(value: Any) -> float | None:
-    if value in (None, ""):
+    # Coordinates usually arrive as floats already; skip the tuple test and try block.
+    if type(value) is float:
+        return value
+    if value is None or value == "":
         return None
     try:
         return float(value)
@@ -332,7 +734,9 @@ def _to_optional_float(value: Any) -> float | None:
 
 
 def _to_optional_int(value: Any) -> int | None:
-    if value in (None, ""):
+    if type(value) is int:
+        return value
+    if value is None or value == "":
         return None
     try:
         return int(value)
@@ -372,13 +776,19 @@ def _parse_naver_rating_summary(
     content_text: str | None,
     html: str | None = None,
 ) -> dict[str, Any]:
-    text = " ".join((content_text or "").split())
+    # Every whitespace gap in the text patterns is \s*, so collapsing runs of whitespace
+    # first cannot change a match; skip that pass over the (often very large) body text.
+    text = content_text or ""
     html_text = html or ""
+    if not any(sentinel in html_text for sentinel in RATING_HTML_SENTINELS):
+        html_text = ""
 
     score: float | None = None
     rating_count: int | None = None
 
-    for pattern in RATING_SCORE_COUNT_HTML_PATTERNS:
+    for pattern, sentinel in zip(RATING_SCORE_COUNT_HTML_SCANNERS, RATING_SCORE_COUNT_HTML_SENTINELS):
+        if sentinel not in html_text:
+            continue
         match = pattern.search(html_text)
         if not match:
             continue
@@ -391,44 +801,18 @@ def _parse_naver_rating_summary(
         if score is not None and rating_count is not None:
             break
 
-    for pattern in RATING_SCORE_TEXT_PATTERNS:
-        match = pattern.search(text)
-        if not match:
-            continue
-        parsed_score = _parse_rating_score(match.group(1))
-        if parsed_score is not None:
-            score = parsed_score
-            break
+    parsed_score = RATING_SCORE_TEXT_UNION.first_parsed(text, _parse_rating_score)
+    if parsed_score is not None:
+        score = parsed_score
 
     if score is None:
-        for pattern in RATING_SCORE_HTML_PATTERNS:
-            match = pattern.search(html_text)
-            if not match:
-                continue
-            parsed_score = _parse_rating_score(match.group(1))
-            if parsed_score is not None:
-                score = parsed_score
-                break
+        score = RATING_SCORE_HTML_UNION.first_parsed(html_text, _parse_rating_score)
 
     if rating_count is None:
-        for pattern in RATING_COUNT_TEXT_PATTERNS:
-            match = pattern.search(text)
-            if not match:
-                continue
-            parsed_count = _parse_rating_count(match.group(1))
-            if parsed_count is not None:
-                rating_count = parsed_count
-                break
+        rating_count = RATING_COUNT_TEXT_UNION.first_parsed(text, _parse_rating_count)
 
     if rating_count is None:
-        for pattern in RATING_COUNT_HTML_PATTERNS:
-            match = pattern.search(html_text)
-            if not match:
-                continue
-            parsed_count = _parse_rating_count(match.group(1))
-            if parsed_count is not None:
-                rating_count = parsed_count
-                break
+        rating_count = RATING_COUNT_HTML_UNION.first_parsed(html_text, _parse_rating_count)
 
     if score is None and rating_count is None:
         return {}
@@ -442,6 +826,9 @@ def _parse_naver_rating_summary(
 def _haversine_distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     earth_radius_m = 6371000.0
     d_lat = radians(lat2 - lat1)
+    if lon1 == lon2:
+        # On a shared meridian the haversine collapses to the latitude arc; no trig needed.
+        return earth_radius_m * abs(d_lat)
     d_lon = radians(lon2 - lon1)
     a = sin(d_lat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(d_lon / 2) ** 2
     c = 2 * asin(min(1.0, sqrt(a)))
@@ -459,13 +846,43 @@ def _distance_m(
     return _haversine_distance_m(kakao_y, kakao_x, candidate_y, candidate_x)
 
 
+def _distances_from_origin_m(
+    origin_x: float | None,
+    origin_y: float | None,
+    points: list[tuple[float | None, float | None]],
+) -> list[float | None]:
+    """Batch haversine from one (x=lng, y=lat) origin; the origin trig is computed once."""
+    if origin_x is None or origin_y is None:
+        return [None] * len(points)
+
+    earth_radius_m = 6371000.0
+    origin_lat = radians(origin_y)
+    origin_lon = radians(origin_x)
+    origin_cos = cos(origin_lat)
+    distances: list[float | None] = []
+    for point_x, point_y in points:
+        if point_x is None or point_y is None:
+            distances.append(None)
+            continue
+        point_lat = radians(point_y)
+        if point_x == origin_x:
+            distances.append(earth_radius_m * abs(point_lat - origin_lat))
+            continue
+        a = (
+            sin((point_lat - origin_lat) / 2) ** 2
+            + origin_cos * cos(point_lat) * sin((radians(point_x) - origin_lon) / 2) ** 2
+        )
+        distances.append(earth_radius_m * 2 * asin(min(1.0, sqrt(a))))
+    return distances
+
+
 def _extract_region_tokens(address: str | None, max_tokens: int = 3) -> list[str]:
     if not address:
         return []
 
     tokens: list[str] = []
     for raw_token in address.strip().split():
-        token = NON_WORD_PATTERN.sub("", raw_token.lower())
+        token = raw_token.lower().translate(NON_WORD_REMOVE)
         if len(token) < 2:
             continue
         if token.isdigit():
@@ -502,29 +919,73 @@ def _pick_best_kakao_document(
             if str(doc.get("id") or "").strip() == normalized_place_id:
                 return doc
 
-    best_doc: dict[str, Any] | None = None
-    best_score = -1.0
+    named_docs: list[tuple[dict[str, Any], str]] = []
     for doc in documents:
         doc_name = str(doc.get("place_name") or "").strip()
-        if not doc_name:
-            continue
-
-        name_score = _name_similarity(place_name, doc_name)
-        doc_x = _to_optional_float(doc.get("x"))
-        doc_y = _to_optional_float(doc.get("y"))
-        distance_m = _distance_m(x, y, doc_x, doc_y)
+        if doc_name:
+            named_docs.append((doc, doc_name))
+    if not named_docs:
+        return None
 
+    doc_distances = _distances_from_origin_m(
+        x,
+        y,
+        [(_to_optional_float(doc.get("x")), _to_optional_float(doc.get("y"))) for doc, _ in named_docs],
+    )
+    scores: list[float] = []
+    for (_, doc_name), distance_m in zip(named_docs, doc_distances):
         proximity_bonus = 0.0
         if distance_m is not None:
             # 0~2km 범위에서 최대 +0.35 가산.
             proximity_bonus = max(0.0, 0.35 - min(distance_m, 2000.0) / 2000.0 * 0.35)
+        scores.append(_name_similarity(place_name, doc_name) + proximity_bonus)
+
+    # max() keeps the first of equal scores, like the strict ">" scan it replaces.
+    best_index = max(range(len(scores)), key=scores.__getitem__)
+    return named_docs[best_index][0]
+
+
+_KAKAO_HTTP_SESSION: requests.Session | None = None
+_KAKAO_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def _get_kakao_http_session() -> requests.Session:
+    """Shared keep-alive session so Kakao lookups reuse pooled TLS connections."""
+    global _KAKAO_HTTP_SESSION
+    if _KAKAO_HTTP_SESSION is None:
+        with _KAKAO_HTTP_SESSION_LOCK:
+            if _KAKAO_HTTP_SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=64,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.2,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("https://", adapter)
+                _KAKAO_HTTP_SESSION = session
+    return _KAKAO_HTTP_SESSION
+
+
+_KAKAO_REST_API_KEY: str | None = None
+_KAKAO_HEADERS: dict[str, str] | None = None
 
-        score = name_score + proximity_bonus
-        if score > best_score:
-            best_score = score
-            best_doc = doc
 
-    return best_doc
+def refresh_kakao_key() -> bool:
+    """Re-read KAKAO_REST_API_KEY from the environment; returns whether a key is set."""
+    global _KAKAO_REST_API_KEY, _KAKAO_HEADERS
+    rest_api_key = (os.getenv("KAKAO_REST_API_KEY") or "").strip() or None
+    # Swap the headers in one assignment so concurrent lookups never see a half-updated pair.
+    _KAKAO_HEADERS = {"Authorization": f"KakaoAK {rest_api_key}"} if rest_api_key else None
+    _KAKAO_REST_API_KEY = rest_api_key
+    return rest_api_key is not None
+
+
+refresh_kakao_key()
 
 
 def _fetch_kakao_place_context(
@@ -547,8 +1008,8 @@ def _fetch_kakao_place_context(
     if not normalized_name:
         return base_context
 
-    rest_api_key = (os.getenv("KAKAO_REST_API_KEY") or "").strip()
-    if not rest_api_key:
+    headers = _KAKAO_HEADERS
+    if headers is None:
         return base_context
 
     params: dict[str, Any] = {
@@ -566,9 +1027,9 @@ def _fetch_kakao_place_context(
         )
 
     try:
-        response = requests.get(
+        response = _get_kakao_http_session().get(
             KAKAO_KEYWORD_SEARCH_URL,
-            headers={"Authorization": f"KakaoAK {rest_api_key}"},
+            headers=headers,
             params=params,
             timeout=(1.5, config.kakao_lookup_timeout_sec),
         )
@@ -590,7 +1051,8 @@ def _fetch_kakao_place_context(
         return base_context
 
     try:
-        documents = response.json().get("documents", [])
+        payload = orjson.loads(response.content) if orjson is not None else response.json()
+        documents = payload.get("documents", [])
     except Exception:
         logger.warning(
             "naver.mapping.kakao_lookup.parse_failed kakao_place_id=%s",
@@ -639,6 +1101,64 @@ def _fetch_kakao_place_context(
     return resolved_context
 
 
+def batch_fetch_kakao_place_contexts(
+    items: list[dict[str, Any]],
+    *,
+    _config: NaverCrawlerConfig | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Prefetch Kakao lookups for a batch of places concurrently, keyed by kakao_place_id.
+
+    The lookups are plain blocking HTTP calls, so a small thread pool overlaps them;
+    pass each result to crawl_naver_place_bundle(kakao_context=...).
+    """
+    config = _config or _load_config()
+    unique_items: dict[str, dict[str, Any]] = {}
+    for item in items:
+        kakao_place_id = str(item.get("kakao_place_id") or "").strip()
+        if kakao_place_id and kakao_place_id not in unique_items:
+            unique_items[kakao_place_id] = item
+    if not unique_items:
+        return {}
+
+    def fetch(kakao_place_id: str, item: dict[str, Any]) -> dict[str, Any]:
+        return _fetch_kakao_place_context(
+            kakao_place_id=kakao_place_id,
+            place_name=item.get("place_name"),
+            x=_to_optional_float(item.get("x")),
+            y=_to_optional_float(item.get("y")),
+            config=config,
+        )
+
+    contexts: dict[str, dict[str, Any]] = {}
+    max_workers = min(config.kakao_lookup_concurrency, len(unique_items))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kakao-lookup") as executor:
+        futures = {
+            executor.submit(fetch, kakao_place_id, item): kakao_place_id
+            for kakao_place_id, item in unique_items.items()
+        }
+        for future in as_completed(futures):
+            kakao_place_id = futures[future]
+            try:
+                contexts[kakao_place_id] = future.result()
+            except Exception:
+                logger.warning(
+                    "naver.mapping.kakao_lookup.batch_error kakao_place_id=%s",
+                    kakao_place_id,
+                    exc_info=True,
+                )
+    return contexts
+
+
+def _dedupe_queries(queries: list[str]) -> list[str]:
+    # Whitespace-collapsed, case-insensitive, first spelling wins; dict keeps insertion order.
+    deduped: dict[str, str] = {}
+    for query in queries:
+        cleaned = " ".join(query.split())
+        if cleaned:
+            deduped.setdefault(cleaned.lower(), cleaned)
+    return list(deduped.values())
+
+
 def _build_mapping_queries(place_name: str, kakao_context: dict[str, Any]) -> list[str]:
     normalized_name = " ".join(place_name.split()).strip()
     if not normalized_name:
@@ -660,18 +1180,7 @@ def _build_mapping_queries(place_name: str, kakao_context: dict[str, Any]) -> li
 
     queries.append(normalized_name)
 
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for query in queries:
-        normalized_query = " ".join(query.split()).strip()
-        if not normalized_query:
-            continue
-        key = normalized_query.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(normalized_query)
-    return deduped
+    return _dedupe_queries(queries)
 
 
 def _build_address_query_variants(address: str | None) -> list[str]:
@@ -690,75 +1199,88 @@ def _build_address_query_variants(address: str | None) -> list[str]:
     if len(tokens) >= 4:
         variants.append(" ".join(tokens[:4]))
 
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for variant in variants:
-        cleaned = " ".join(variant.split()).strip()
-        if not cleaned:
-            continue
-        key = cleaned.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(cleaned)
-    return deduped
+    return _dedupe_queries(variants)
 
 
-def _extract_route_coord_lookup(page: Page) -> dict[str, tuple[float, float]]:
+def _extract_route_coord_lookup(page: Page, config: NaverCrawlerConfig) -> dict[str, tuple[float, float]]:
     lookup: dict[str, tuple[float, float]] = {}
+    # Mapping never keeps more than the discovery limit of candidates, so stop once that
+    # many place ids have coordinates; hrefs repeat per card, hence the wider anchor cap.
+    lookup_limit = _mapping_discovery_limit(config)
+    anchor_limit = min(ROUTE_COORD_ANCHOR_LIMIT, lookup_limit * 4)
     try:
-        locator = page.locator("a[href*='nso_path']")
-        count = min(locator.count(), 120)
+        # One evaluate round-trip instead of a locator.nth()/get_attribute() RPC per anchor.
+        hrefs = page.evaluate(ROUTE_COORD_HREFS_SCRIPT, anchor_limit)
     except Exception:
         return lookup
+    if not isinstance(hrefs, list):
+        return lookup
 
-    for index in range(count):
-        anchor = locator.nth(index)
-        href = _extract_attr(anchor, ["href"])
-        if not href:
-            continue
-
-        parsed = urlparse(urljoin(page.url, href))
-        nso_path_raw = parse_qs(parsed.query).get("nso_path", [None])[0]
-        if not nso_path_raw:
-            continue
-        nso_path = unquote(nso_path_raw)
-
-        code_match = NAVER_ROUTE_CODE_PATTERN.search(nso_path)
-        lng_match = NAVER_ROUTE_LNG_PATTERN.search(nso_path)
-        lat_match = NAVER_ROUTE_LAT_PATTERN.search(nso_path)
-        if not code_match or not lng_match or not lat_match:
+    for href in hrefs:
+        if not isinstance(href, str) or not href.strip():
             continue
 
-        naver_place_id = str(code_match.group(1) or "").strip()
-        lng = _to_optional_float(lng_match.group(1))
-        lat = _to_optional_float(lat_match.group(1))
-        if not naver_place_id or lng is None or lat is None:
+        route_coord = _parse_route_coord(href.strip())
+        if route_coord is None:
             continue
+        naver_place_id, lng, lat = route_coord
         lookup[naver_place_id] = (lng, lat)
+        if len(lookup) >= lookup_limit:
+            break
 
     return lookup
 
 
+def _parse_route_coord(href: str) -> tuple[str, float, float] | None:
+    # Pull nso_path straight out of the raw href instead of urljoin/urlparse/parse_qs;
+    # the value is percent-encoded twice, matching parse_qs + unquote.
+    nso_match = NAVER_NSO_PATH_QUERY_PATTERN.search(href.partition("#")[0])
+    if not nso_match or not nso_match.group(1):
+        return None
+    nso_path = unquote(unquote_plus(nso_match.group(1)))
+
+    fields: dict[str, str] = {}
+    for match in NAVER_ROUTE_FIELDS_PATTERN.finditer(nso_path):
+        fields.setdefault(match.lastgroup, match.group(match.lastgroup))
+    if len(fields) < 3:
+        return None
+
+    naver_place_id = fields["code"].strip()
+    lng = _to_optional_float(fields["lng"])
+    lat = _to_optional_float(fields["lat"])
+    if not naver_place_id or lng is None or lat is None:
+        return None
+    return naver_place_id, lng, lat
+
+
 def _parse_place_id(href: str | None) -> str | None:
     if not href:
         return None
-    for pattern in PLACE_ID_PATTERNS:
-        match = pattern.search(href)
-        if match:
-            return match.group(1)
+    return PLACE_ID_UNION.first_parsed(href, str)
+
+
+def _query_value(query: str, key: str) -> str | None:
+    """First non-blank value of ``key`` in ``query``, decoded like ``parse_qs(query)[key][0]``.
+
+    Scans the pairs directly instead of building the full parse_qs dict of lists.
+    """
+    for part in query.split("&"):
+        name, has_value, value = part.partition("=")
+        if not has_value or not value:
+            continue
+        if name != key and not (("%" in name or "+" in name) and unquote_plus(name) == key):
+            continue
+        return unquote_plus(value)
     return None
 
 
 def _extract_coord_from_href(href: str | None, key: str) -> float | None:
     if not href:
         return None
-    parsed = urlparse(href)
-    query = parse_qs(parsed.query)
-    values = query.get(key)
-    if not values:
+    value = _query_value(urlparse(href).query, key)
+    if value is None:
         return None
-    return _to_optional_float(values[0])
+    return _to_optional_float(value)
 
 
 def _safe_build_mapping_payload(
@@ -790,18 +1312,24 @@ def _select_best_mapping_candidate(
     kakao_y: float | None = None,
     kakao_address: str | None = None,
 ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
-    scored_candidates: list[dict[str, Any]] = []
+    """Return the best candidate (or None) and the top-ranked scored candidates."""
+    keyed_candidates: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
     region_tokens = _extract_region_tokens(kakao_address)
 
-    for candidate in candidates:
+    candidate_points = [
+        (_to_optional_float(candidate.get("x")), _to_optional_float(candidate.get("y")))
+        for candidate in candidates
+    ]
+    candidate_distances = _distances_from_origin_m(kakao_x, kakao_y, candidate_points)
+
+    for candidate, (candidate_x, candidate_y), distance_m in zip(
+        candidates, candidate_points, candidate_distances
+    ):
         naver_place_id = str(candidate.get("naver_place_id") or "").strip()
         matched_name = str(candidate.get("matched_name") or "").strip()
         if not naver_place_id or not matched_name:
             continue
 
-        candidate_x = _to_optional_float(candidate.get("x"))
-        candidate_y = _to_optional_float(candidate.get("y"))
-        distance_m = _distance_m(kakao_x, kakao_y, candidate_x, candidate_y)
         snippet = str(candidate.get("snippet") or "").strip()
         region_score = _region_similarity(
             region_tokens,
@@ -847,20 +1375,25 @@ def _select_best_mapping_candidate(
             "source_url": candidate.get("source_url"),
             "snippet": snippet or None,
         }
-        scored_candidates.append(scored)
+        sort_key = (
+            -scored["confidence"],
+            -scored["region_score"],
+            -scored["name_score"],
+            scored["distance_m"] if scored["distance_m"] is not None else float("inf"),
+            naver_place_id,
+        )
+        keyed_candidates.append((sort_key, scored))
 
-    if not scored_candidates:
+    if not keyed_candidates:
         return None, []
 
-    scored_candidates.sort(
-        key=lambda row: (
-            -row["confidence"],
-            -row["region_score"],
-            -row["name_score"],
-            row["distance_m"] if row["distance_m"] is not None else float("inf"),
-            row["naver_place_id"],
+    # Only the top few are ever used (ambiguity check + payload), so skip the full sort.
+    scored_candidates = [
+        scored
+        for _, scored in heapq.nsmallest(
+            MAPPING_TOP_CANDIDATE_LIMIT, keyed_candidates, key=itemgetter(0)
         )
-    )
+    ]
 
     best_candidate = scored_candidates[0]
     if len(scored_candidates) > 1:
@@ -883,13 +1416,61 @@ def _select_best_mapping_candidate(
     return best_candidate, scored_candidates
 
 
+_PACING_RNG_LOCAL = threading.local()
+
+
+def _pacing_rng() -> random.Random:
+    # Browser sessions are thread-affine, so a per-thread generator is effectively
+    # per-session and keeps parallel crawlers off the shared module-level instance.
+    rng = getattr(_PACING_RNG_LOCAL, "rng", None)
+    if rng is None:
+        rng = random.Random(os.urandom(8))
+        _PACING_RNG_LOCAL.rng = rng
+    return rng
+
+
+def _paced_delay_ms(config: NaverCrawlerConfig, multiplier: float = 1.0) -> int:
+    base_ms = int(config.request_delay_ms * max(multiplier, 0.0))
+    jitter_range = max(1, int(base_ms * 0.35))
+    return max(0, base_ms + _pacing_rng().randint(-jitter_range, jitter_range))
+
+
 def _paced_wait(page: Page, config: NaverCrawlerConfig, multiplier: float = 1.0) -> None:
     if config.request_delay_ms <= 0:
         return
-    base_ms = int(config.request_delay_ms * max(multiplier, 0.0))
-    jitter_range = max(1, int(base_ms * 0.35))
-    jittered = max(0, base_ms + random.randint(-jitter_range, jitter_range))
-    page.wait_for_timeout(jittered)
+    page.wait_for_timeout(_paced_delay_ms(config, multiplier))
+
+
+def _wait_for_count_increase(
+    page: Page,
+    selector: str,
+    previous_count: int | None,
+    config: NaverCrawlerConfig,
+) -> bool:
+    """Wait up to one paced delay for more ``selector`` matches; True if they arrived early.
+
+    Ends the wait as soon as new items render instead of always sleeping the full delay.
+    A timeout means the whole paced delay has already elapsed; other failures (unknown
+    count, evaluation errors) fall back to the plain paced wait.
+    """
+    if config.request_delay_ms <= 0:
+        return False
+    timeout_ms = _paced_delay_ms(config)
+    if previous_count is None or timeout_ms <= 0:
+        page.wait_for_timeout(timeout_ms)
+        return False
+    try:
+        page.wait_for_function(
+            COUNT_INCREASE_SCRIPT,
+            arg=[selector, previous_count],
+            timeout=timeout_ms,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+    except Exception:
+        page.wait_for_timeout(timeout_ms)
+        return False
 
 
 def _retry_action(
@@ -923,49 +1504,303 @@ def _retry_action(
             )
 
         if attempt < retries:
-            time.sleep(retry_interval_sec + random.uniform(0.05, 0.2))
+            time.sleep(retry_interval_sec + _pacing_rng().uniform(0.05, 0.2))
 
     if last_exc:
         raise last_exc
     return None
 
 
+def _launch_browser(playwright: Playwright, config: NaverCrawlerConfig) -> Browser:
+    """Attach to a long-lived Chromium over CDP when one is configured, else launch one.
+
+    An external browser (e.g. a sidecar started with --remote-debugging-port) outlives
+    worker restarts, so a fresh worker skips the Chromium cold start; close() on a
+    CDP-attached browser only disconnects.
+    """
+    if config.browser_cdp_endpoint:
+        try:
+            return playwright.chromium.connect_over_cdp(
+                config.browser_cdp_endpoint,
+                timeout=config.timeout_ms,
+            )
+        except Exception:
+            logger.warning(
+                "naver.browser.cdp_connect_failed endpoint=%s; launching a local browser",
+                config.browser_cdp_endpoint,
+                exc_info=True,
+            )
+    return playwright.chromium.launch(headless=config.headless)
+
+
+class _BrowserPool:
+    """Playwright driver + Chromium kept alive across sessions.
+
+    Only the browser is pooled: every session gets a fresh context, so cookies, storage,
+    HTTP cache and permissions never carry over from one place's crawl to the next.
+    The sync Playwright API is bound to the thread that started it, so each thread
+    gets its own pool (see _get_browser_pool). Chromium is relaunched once it has
+    served browser_max_uses sessions or outlived browser_max_age_sec, but only while
+    no session from this pool is checked out.
+    """
+
+    def __init__(self) -> None:
+        self.playwright: Playwright | None = None
+        self.browser: Browser | None = None
+        self.headless: bool | None = None
+        self.launched_at = 0.0
+        self.uses = 0
+        self.checked_out = 0
+
+    def _should_recycle(self, config: NaverCrawlerConfig) -> bool:
+        if self.browser is None or self.checked_out > 0:
+            return False
+        return (
+            self.uses >= config.browser_max_uses
+            or time.monotonic() - self.launched_at > config.browser_max_age_sec
+        )
+
+    def get_browser(self, config: NaverCrawlerConfig) -> Browser:
+        if self._should_recycle(config):
+            logger.info(
+                "naver.browser_pool.recycle uses=%s age_sec=%.0f",
+                self.uses,
+                time.monotonic() - self.launched_at,
+            )
+            self.shutdown()
+        if self.browser is not None and (
+            self.headless != config.headless or not self.browser.is_connected()
+        ):
+            self.shutdown()
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        if self.browser is None:
+            self.browser = _launch_browser(self.playwright, config)
+            self.headless = config.headless
+            self.launched_at = time.monotonic()
+            self.uses = 0
+        return self.browser
+
+    def acquire_context(self, config: NaverCrawlerConfig, context_kwargs: dict[str, Any]) -> BrowserContext:
+        # Count the checkout only once a context exists; a failed new_context() must
+        # not leave checked_out stuck above zero, which would block recycling forever.
+        context = self.new_context(config, context_kwargs)
+        self.uses += 1
+        self.checked_out += 1
+        return context
+
+    def new_context(self, config: NaverCrawlerConfig, context_kwargs: dict[str, Any]) -> BrowserContext:
+        context = self.get_browser(config).new_context(**context_kwargs)
+        _install_resource_blocking(context, config)
+        return context
+
+    def release_context(self, context: BrowserContext) -> None:
+        self.checked_out = max(0, self.checked_out - 1)
+        context.close()
+
+    def shutdown(self) -> None:
+        close_errors: list[str] = []
+        for close_name, close_fn in (
+            ("browser", self.browser.close if self.browser is not None else None),
+            ("playwright", self.playwright.stop if self.playwright is not None else None),
+        ):
+            if close_fn is None:
+                continue
+            try:
+                close_fn()
+            except Exception as exc:
+                close_errors.append(f"{close_name}:{exc}")
+        self.browser = None
+        self.playwright = None
+        self.headless = None
+        self.uses = 0
+        if close_errors:
+            logger.warning("naver.browser_pool.shutdown_partial_failure details=%s", close_errors)
+
+
+_BROWSER_POOL_LOCAL = threading.local()
+_BROWSER_POOLS: list[_BrowserPool] = []
+_BROWSER_POOLS_LOCK = threading.Lock()
+
+
+def _get_browser_pool() -> _BrowserPool:
+    pool = getattr(_BROWSER_POOL_LOCAL, "pool", None)
+    if pool is None:
+        pool = _BrowserPool()
+        _BROWSER_POOL_LOCAL.pool = pool
+        with _BROWSER_POOLS_LOCK:
+            _BROWSER_POOLS.append(pool)
+    return pool
+
+
+def warm_browser_pool() -> None:
+    """Launch Chromium in the calling thread's pool so the first crawl skips the cold start.
+
+    Meant for Celery's worker_process_init: under the prefork pool, tasks run on the
+    thread that receives that signal, which is the thread the sync API is bound to.
+    """
+    config = _load_config()
+    if sync_playwright is None or not config.browser_reuse:
+        return
+    try:
+        _get_browser_pool().get_browser(config)
+    except Exception:
+        logger.warning("naver.browser_pool.warm_failed", exc_info=True)
+
+
+@atexit.register
+def _shutdown_thread_browser_pool() -> None:
+    """Close the calling thread's pool; sync Playwright objects only work on their own thread."""
+    pool = getattr(_BROWSER_POOL_LOCAL, "pool", None)
+    if pool is not None:
+        pool.shutdown()
+
+
+def _run_on_crawl_threads(fn: Callable[[], None], timeout_sec: float = 30.0) -> None:
+    """Run ``fn`` once on every bundle executor thread.
+
+    Each call waits on a barrier sized to the executor, so no thread can take two of
+    them and the executor has to start (or hand over) all of its threads.
+    """
+    with _BUNDLE_EXECUTOR_LOCK:
+        executor = _BUNDLE_EXECUTOR
+        workers = _BUNDLE_EXECUTOR_WORKERS
+    if executor is None:
+        return
+
+    barrier = threading.Barrier(workers)
+
+    def pinned() -> None:
+        try:
+            barrier.wait(timeout=timeout_sec)
+        except threading.BrokenBarrierError:
+            logger.warning("naver.browser_pool.crawl_threads_busy workers=%s", workers)
+        fn()
+
+    for future in [executor.submit(pinned) for _ in range(workers)]:
+        try:
+            future.result()
+        except Exception:
+            logger.warning("naver.browser_pool.thread_task_failed", exc_info=True)
+
+
+def shutdown_browser_pools() -> None:
+    """Close the bundle executor threads' pools on their own threads, then the caller's."""
+    _run_on_crawl_threads(_shutdown_thread_browser_pool)
+    _shutdown_thread_browser_pool()
+    with _BROWSER_POOLS_LOCK:
+        # Pools of other threads (e.g. a threaded Celery pool) must be closed by their owners.
+        left_open = sum(1 for pool in _BROWSER_POOLS if pool.browser is not None)
+    if left_open:
+        logger.warning("naver.browser_pool.foreign_pools_open count=%s", left_open)
+
+
+def _abort_heavy_resource(route: Any) -> None:
+    try:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_TRACKER_URL_PATTERN.search(request.url):
+            route.abort()
+        else:
+            route.continue_()
+    except Exception:
+        logger.debug("naver.route.handler_failed", exc_info=True)
+
+
+def _install_resource_blocking(context: BrowserContext, config: NaverCrawlerConfig) -> None:
+    if not config.block_heavy_resources:
+        return
+    try:
+        # A URL pattern keeps ordinary document/XHR traffic off the Python route handler.
+        context.route(BLOCKED_RESOURCE_URL_PATTERN, _abort_heavy_resource)
+    except Exception:
+        logger.warning("naver.route.install_failed", exc_info=True)
+
+
 def _create_browser_session(config: NaverCrawlerConfig) -> BrowserSession:
     if sync_playwright is None:
         raise RuntimeError("Playwright is not available in this environment")
 
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=config.headless)
     context_kwargs: dict[str, Any] = {}
     if config.user_agent:
         context_kwargs["user_agent"] = config.user_agent
 
-    context = browser.new_context(**context_kwargs)
-    page = context.new_page()
+    if not config.browser_reuse:
+        playwright = sync_playwright().start()
+        browser = _launch_browser(playwright, config)
+        context = browser.new_context(**context_kwargs)
+        _install_resource_blocking(context, config)
+        page = context.new_page()
+        page.set_default_timeout(config.timeout_ms)
+        return BrowserSession(playwright=playwright, browser=browser, context=context, page=page)
+
+    pool = _get_browser_pool()
+    context = pool.acquire_context(config, context_kwargs)
+    try:
+        page = context.new_page()
+    except Exception:
+        try:
+            pool.release_context(context)
+        except Exception:
+            logger.warning("naver.browser_pool.context_close_failed", exc_info=True)
+        raise
     page.set_default_timeout(config.timeout_ms)
-    return BrowserSession(playwright=playwright, browser=browser, context=context, page=page)
+    return BrowserSession(
+        playwright=pool.playwright,
+        browser=pool.browser,
+        context=context,
+        page=page,
+        pool=pool,
+    )
 
 
-def _close_browser_session(session: BrowserSession | None) -> None:
+def _close_browser_session(
+    session: BrowserSession | None,
+    config: NaverCrawlerConfig | None = None,
+) -> None:
     if session is None:
         return
 
     close_errors: list[str] = []
-    for close_name, close_fn in (
-        ("page", session.page.close),
-        ("context", session.context.close),
-        ("browser", session.browser.close),
-        ("playwright", session.playwright.stop),
-    ):
+    try:
+        session.page.close()
+    except Exception as exc:
+        close_errors.append(f"page:{exc}")
+
+    if session.pool is not None:
         try:
-            close_fn()
+            session.pool.release_context(session.context)
         except Exception as exc:
-            close_errors.append(f"{close_name}:{exc}")
+            close_errors.append(f"context:{exc}")
+    else:
+        for close_name, close_fn in (
+            ("context", session.context.close),
+            ("browser", session.browser.close),
+            ("playwright", session.playwright.stop),
+        ):
+            try:
+                close_fn()
+            except Exception as exc:
+                close_errors.append(f"{close_name}:{exc}")
 
     if close_errors:
         logger.warning("naver.cleanup.partial_failure details=%s", close_errors)
 
 
+_PAGE_LOCATORS: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _page_locator(page: Page, selector: str) -> Any:
+    """Reuse one Locator per (page, selector); the crawl loops re-query the same selectors."""
+    try:
+        locators = _PAGE_LOCATORS.setdefault(page, {})
+    except TypeError:
+        return page.locator(selector)
+    locator = locators.get(selector)
+    if locator is None:
+        locator = locators[selector] = page.locator(selector)
+    return locator
+
+
 def _safe_goto(page: Page, url: str, timeout_ms: int) -> bool:
     try:
         _retry_action(
@@ -981,7 +1816,7 @@ def _safe_goto(page: Page, url: str, timeout_ms: int) -> bool:
 def _safe_click(page: Page, selectors: list[str], timeout_ms: int, action_name: str) -> bool:
     for selector in selectors:
         try:
-            locator = page.locator(selector)
+            locator = _page_locator(page, selector)
             if locator.count() <= 0:
                 continue
 
@@ -1036,51 +1871,16 @@ def _is_unusable_content_page(page: Page) -> bool:
     (common for some m.place routes in headless environments).
     """
     try:
-        html_len = len(page.content())
+        # One probe instead of serializing the whole DOM over CDP just to measure it.
+        stats = page.evaluate(CONTENT_PAGE_STATS_SCRIPT)
+        html_len = int(stats["html_len"])
     except Exception:
         return False
 
     if html_len >= 10000:
         return False
 
-    try:
-        interactive_count = page.locator("a, button, img").count()
-    except Exception:
-        interactive_count = 0
-
-    return interactive_count < 5
-
-
-def _extract_text(locator: Any, selectors: list[str]) -> str | None:
-    for selector in selectors:
-        try:
-            nested = locator.locator(selector).first
-            if nested.count() <= 0:
-                continue
-            text = (nested.inner_text(timeout=500) or "").strip()
-            if text:
-                return " ".join(text.split())
-        except Exception:
-            continue
-
-    try:
-        fallback = (locator.inner_text(timeout=500) or "").strip()
-        if fallback:
-            return " ".join(fallback.split())
-    except Exception:
-        pass
-    return None
-
-
-def _extract_attr(locator: Any, attributes: list[str]) -> str | None:
-    for attr in attributes:
-        try:
-            value = locator.get_attribute(attr)
-        except Exception:
-            value = None
-        if value:
-            return value.strip()
-    return None
+    return int(stats.get("interactive_count") or 0) < 5
 
 
 def _extract_rating_summary(page: Page) -> dict[str, Any]:
@@ -1088,14 +1888,26 @@ def _extract_rating_summary(page: Page) -> dict[str, Any]:
     page_html = ""
 
     try:
-        page_text = (page.inner_text("body", timeout=1500) or "").strip()
+        page_text, page_html = page.evaluate(
+            PAGE_TEXT_AND_RATING_HTML_SCRIPT,
+            [
+                "|".join(re.escape(sentinel) for sentinel in RATING_HTML_SENTINELS),
+                RATING_HTML_SLICE_CHARS,
+                RATING_HTML_MAX_SLICES,
+            ],
+        )
+        page_text = (page_text or "").strip()
+        page_html = page_html or ""
     except Exception:
-        page_text = ""
+        try:
+            page_text = (page.inner_text("body", timeout=1500) or "").strip()
+        except Exception:
+            page_text = ""
 
-    try:
-        page_html = page.content() or ""
-    except Exception:
-        page_html = ""
+        try:
+            page_html = page.content() or ""
+        except Exception:
+            page_html = ""
 
     summary = _parse_naver_rating_summary(page_text, page_html)
     if summary:
@@ -1107,37 +1919,47 @@ def _extract_rating_summary(page: Page) -> dict[str, Any]:
     return summary
 
 
-def _parse_posted_at_iso(raw_value: str | None) -> str | None:
+RELATIVE_DATE_DELTAS: dict[str, Callable[[int], timedelta]] = {
+    "분": lambda count: timedelta(minutes=count),
+    "시간": lambda count: timedelta(hours=count),
+    "일": lambda count: timedelta(days=count),
+    "주": lambda count: timedelta(weeks=count),
+    "개월": lambda count: timedelta(days=count * 30),
+    "달": lambda count: timedelta(days=count * 30),
+    "년": lambda count: timedelta(days=count * 365),
+}
+
+
+def _utc_now_naive() -> datetime:
+    """Second-truncated naive UTC `now`; batch callers take one and pass it to every parse."""
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def _parse_posted_at_iso(raw_value: str | None, *, now: datetime | None = None) -> str | None:
     if not raw_value:
         return None
+    return _parse_posted_at_iso_cached(raw_value, now or _utc_now_naive())
+
 
-    text = " ".join(raw_value.split())
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+@lru_cache(maxsize=2048)
+def _parse_posted_at_iso_cached(raw_value: str, now: datetime) -> str | None:
+    # Keyed on (raw, now): a page repeats the same relative strings ("3일 전"), and callers
+    # pass one truncated `now` per batch. The patterns tolerate any whitespace run via \s*,
+    # so the raw value is searched as-is.
+    text = raw_value
 
     if "오늘" in text:
-        return now.replace(microsecond=0).isoformat()
+        return now.isoformat()
     if "어제" in text:
-        return (now - timedelta(days=1)).replace(microsecond=0).isoformat()
+        return (now - timedelta(days=1)).isoformat()
     if "방금" in text:
-        return now.replace(microsecond=0).isoformat()
+        return now.isoformat()
 
     relative_match = RELATIVE_DATE_PATTERN.search(text)
     if relative_match:
         count = int(relative_match.group("count"))
-        unit = relative_match.group("unit")
-        if unit == "분":
-            parsed = now - timedelta(minutes=count)
-        elif unit == "시간":
-            parsed = now - timedelta(hours=count)
-        elif unit == "일":
-            parsed = now - timedelta(days=count)
-        elif unit == "주":
-            parsed = now - timedelta(weeks=count)
-        elif unit in {"개월", "달"}:
-            parsed = now - timedelta(days=count * 30)
-        else:
-            parsed = now - timedelta(days=count * 365)
-        return parsed.replace(microsecond=0).isoformat()
+        delta = RELATIVE_DATE_DELTAS[relative_match.group("unit")](count)
+        return (now - delta).isoformat()
 
     date_match = DATE_PATTERN.search(text)
     if not date_match:
@@ -1156,88 +1978,214 @@ def _parse_posted_at_iso(raw_value: str | None) -> str | None:
         return None
 
 
-def _review_hash(content: str, author: str | None, posted_at: str | None) -> str:
-    payload = "|".join([content.strip(), (author or "").strip(), (posted_at or "").strip()])
-    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+def _review_hash(dedupe_key: tuple[str, str, str]) -> str:
+    # Non-cryptographic dedupe id: 64-bit BLAKE2b is plenty and cheaper than SHA-1.
+    # The key parts are already stripped, so one join + encode covers the whole payload.
+    return hashlib.blake2b("|".join(dedupe_key).encode("utf-8"), digest_size=8).hexdigest()
 
 
 def _dedupe_reviews(reviews: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    deduped: dict[str, dict[str, Any]] = {}
+    deduped: dict[Any, dict[str, Any]] = {}
+    _merge_reviews(deduped, reviews)
+    return list(deduped.values())
 
-    for review in reviews:
-        content = str(review.get("content") or "").strip()
-        if not content:
-            continue
 
-        author = str(review.get("author") or "").strip() or None
-        posted_at_raw = str(review.get("posted_at") or "").strip() or None
-        posted_at_iso = review.get("posted_at_iso") or _parse_posted_at_iso(posted_at_raw)
-        review_id = str(review.get("review_id") or "").strip() or None
+def _merge_reviews(deduped: dict[Any, dict[str, Any]], reviews: list[dict[str, Any]]) -> int:
+    """Add unseen reviews to ``deduped`` in place; returns how many were new.
 
-        if not review_id:
-            review_id = f"review-{_review_hash(content, author, posted_at_raw)}"
+    Keys are the source review_id, or the (content, author, posted_at) tuple for reviews
+    without one, so duplicates are rejected before any hashing or date parsing.
+    """
+    added = 0
+    now = _utc_now_naive()
+    for review in reviews:
+        review_id = str(review.get("review_id") or "").strip() or None
+        if review_id is not None and review_id in deduped:
+            continue
 
-        if review_id in deduped:
+        content = str(review.get("content") or "").strip()
+        if not content:
             continue
 
-        deduped[review_id] = {
+        author = str(review.get("author") or "").strip() or None
+        posted_at_raw = str(review.get("posted_at") or "").strip() or None
+        dedupe_key: Any = review_id
+        if review_id is None:
+            dedupe_key = (content, author or "", posted_at_raw or "")
+            if dedupe_key in deduped:
+                continue
+            review_id = f"review-{_review_hash(dedupe_key)}"
+
+        deduped[dedupe_key] = {
             "review_id": review_id,
             "content": content,
             "author": author,
             "posted_at": posted_at_raw,
-            "posted_at_iso": posted_at_iso,
+            "posted_at_iso": review.get("posted_at_iso") or _parse_posted_at_iso(posted_at_raw, now=now),
         }
+        added += 1
 
-    return list(deduped.values())
+    return added
 
 
+@lru_cache(maxsize=4096)
 def _normalize_image_url(url: str) -> str:
     raw_url = url.strip()
     parsed = urlparse(raw_url)
     if "search.pstatic.net" in parsed.netloc and parsed.path.startswith("/common"):
-        src_param = parse_qs(parsed.query).get("src", [None])[0]
+        src_param = _query_value(parsed.query, "src")
         if src_param:
-            return unquote(src_param).strip()
+            # Normalize the unwrapped origin URL too so the result is a fixed point; merging
+            # into an already-deduped map then never re-keys a stored photo.
+            return _normalize_image_url(unquote(src_param).strip())
     return parsed._replace(query="", fragment="").geturl()
 
 
 def _photo_dedupe_key(url: str) -> str:
-    parsed = urlparse(url.strip())
-    if "search.pstatic.net" in parsed.netloc and parsed.path.startswith("/common"):
-        src_param = parse_qs(parsed.query).get("src", [None])[0]
-        if src_param:
-            return unquote(src_param).strip()
-    return parsed._replace(query="", fragment="").geturl()
+    # The dedupe key is the normalized URL; share the cached parse instead of redoing it.
+    return _normalize_image_url(url)
 
 
 def _dedupe_photos(photos: list[dict[str, Any]]) -> list[dict[str, Any]]:
     deduped: dict[str, dict[str, Any]] = {}
+    _merge_photos(deduped, photos)
+    return list(deduped.values())
 
+
+def _merge_photos(deduped: dict[str, dict[str, Any]], photos: list[dict[str, Any]]) -> int:
+    """Add unseen photos to ``deduped`` (keyed by normalized URL) in place; returns how many were new."""
+    added = 0
+    now = _utc_now_naive()
     for photo in photos:
         image_url_raw = str(photo.get("image_url") or "").strip()
         if not image_url_raw:
             continue
 
-        image_url = _normalize_image_url(image_url_raw)
-        dedupe_key = _photo_dedupe_key(image_url_raw)
-        if not image_url or not dedupe_key or dedupe_key in deduped:
+        image_url = dedupe_key = _normalize_image_url(image_url_raw)
+        if not image_url or dedupe_key in deduped:
             continue
 
         captured_at = str(photo.get("captured_at") or "").strip() or None
-        captured_at_iso = photo.get("captured_at_iso") or _parse_posted_at_iso(captured_at)
+        captured_at_iso = photo.get("captured_at_iso") or _parse_posted_at_iso(captured_at, now=now)
         metadata = photo.get("metadata")
         if not isinstance(metadata, dict):
             metadata = {}
 
         deduped[dedupe_key] = {
-            "photo_id": f"photo-{hashlib.sha1(image_url.encode('utf-8')).hexdigest()[:16]}",
+            "photo_id": f"photo-{hashlib.blake2b(image_url.encode('utf-8'), digest_size=8).hexdigest()}",
             "image_url": image_url,
             "captured_at": captured_at,
             "captured_at_iso": captured_at_iso,
             "metadata": metadata,
         }
+        added += 1
 
-    return list(deduped.values())
+    return added
+
+
+def _mapping_discovery_limit(config: NaverCrawlerConfig) -> int:
+    return max(12, max(1, config.mapping_candidate_limit) * 6)
+
+
+def _merge_mapping_candidate(
+    candidates: dict[str, dict[str, Any]],
+    current_candidate: dict[str, Any],
+    place_name: str,
+) -> bool:
+    """Insert or upgrade a candidate in place; returns True when the place id is new."""
+    naver_place_id = current_candidate["naver_place_id"]
+    existing = candidates.get(naver_place_id)
+    if existing is None:
+        candidates[naver_place_id] = current_candidate
+        return True
+
+    has_coord_upgrade = (
+        (existing.get("x") is None or existing.get("y") is None)
+        and current_candidate.get("x") is not None
+        and current_candidate.get("y") is not None
+    )
+    has_better_snippet = not existing.get("snippet") and current_candidate.get("snippet")
+    # Cheap field checks first; same-named repeats can never score higher.
+    existing_name = existing.get("matched_name")
+    current_name = current_candidate.get("matched_name")
+    if (
+        has_coord_upgrade
+        or has_better_snippet
+        or (
+            current_name != existing_name
+            and _name_similarity(place_name, current_name) > _name_similarity(place_name, existing_name)
+        )
+    ):
+        candidates[naver_place_id] = current_candidate
+    return False
+
+
+def _capture_place_json_responses(page: Page) -> tuple[list[Any], Callable[[Any], None]]:
+    captured: list[Any] = []
+
+    def on_response(response: Any) -> None:
+        # Only queue here; bodies are read after the paced wait, outside the event callback.
+        try:
+            url = response.url
+        except Exception:
+            return
+        if any(marker in url for marker in MAPPING_JSON_URL_MARKERS):
+            captured.append(response)
+
+    page.on("response", on_response)
+    return captured, on_response
+
+
+def _iter_place_json_records(payload: Any, depth: int = 0) -> Any:
+    if depth > 8:
+        return
+    if isinstance(payload, dict):
+        place_id = str(payload.get("id") or "").strip()
+        if place_id.isdigit() and isinstance(payload.get("name"), str):
+            yield payload
+            return
+        for value in payload.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_place_json_records(value, depth + 1)
+    elif isinstance(payload, list):
+        for value in payload:
+            if isinstance(value, (dict, list)):
+                yield from _iter_place_json_records(value, depth + 1)
+
+
+def _json_mapping_candidates(responses: list[Any], target_url: str) -> list[dict[str, Any]]:
+    """Candidates from Naver's own place-search JSON, so the DOM walk can often be skipped."""
+    extracted: list[dict[str, Any]] = []
+    for response in responses:
+        try:
+            if "json" not in (response.headers.get("content-type") or ""):
+                continue
+            payload = response.json()
+        except Exception:
+            continue
+
+        for record in _iter_place_json_records(payload):
+            candidate_x = _to_optional_float(record.get("x"))
+            candidate_y = _to_optional_float(record.get("y"))
+            if candidate_x is None or candidate_y is None:
+                # Place records always carry coordinates; other id/name objects (categories,
+                # menus) do not, so this keeps them out of the candidate set.
+                continue
+            matched_name = _clean_candidate_name(record.get("name"))
+            if _is_noisy_candidate_name(matched_name):
+                continue
+            snippet = str(record.get("roadAddress") or record.get("address") or "").strip()
+            extracted.append(
+                {
+                    "naver_place_id": str(record["id"]).strip(),
+                    "matched_name": matched_name,
+                    "x": candidate_x,
+                    "y": candidate_y,
+                    "snippet": snippet or None,
+                    "source_url": target_url,
+                }
+            )
+    return extracted
 
 
 def _extract_mapping_candidates(
@@ -1248,127 +2196,236 @@ def _extract_mapping_candidates(
 ) -> list[dict[str, Any]]:
     candidates: dict[str, dict[str, Any]] = {}
     target_limit = max(1, config.mapping_candidate_limit)
-    discovery_limit = max(12, target_limit * 6)
+    discovery_limit = _mapping_discovery_limit(config)
     normalized_queries = query_variants or [place_name.strip()]
     normalized_queries = [query for query in normalized_queries if query.strip()]
 
-    for query in normalized_queries:
-        query_new_candidates = 0
-        for template in MAPPING_URLS:
-            target_url = template.format(query=quote_plus(query))
-            if not _safe_goto(page, target_url, timeout_ms=config.timeout_ms):
-                continue
-
-            _paced_wait(page, config, multiplier=0.8)
-            route_coord_lookup = _extract_route_coord_lookup(page)
-
-            for selector in (
-                "a[href*='m.place.naver.com/place/']",
-                "a[href*='pcmap.place.naver.com/restaurant/']",
-                "a[href*='entry/place/']",
-                "a[href*='/place/']",
-            ):
-                try:
-                    locator = page.locator(selector)
-                    count = min(locator.count(), max(24, target_limit * 10))
-                except Exception:
-                    count = 0
-
-                for index in range(count):
-                    anchor = locator.nth(index)
-                    href = _extract_attr(anchor, ["href"])
-                    if not href:
-                        continue
-
-                    resolved_href = urljoin(page.url, href)
-                    if "/place/list" in resolved_href:
-                        continue
-                    if "/photo" in urlparse(resolved_href).path:
-                        continue
-
-                    naver_place_id = _parse_place_id(resolved_href)
-                    if not naver_place_id:
-                        continue
-
-                    anchor_text = _extract_text(anchor, ["span", "strong", "em"])
-                    if not anchor_text:
-                        try:
-                            anchor_text = (
-                                anchor.evaluate("(el) => (el.getAttribute('title') || el.getAttribute('aria-label') || '').trim()")
-                                or ""
-                            ).strip()
-                        except Exception:
-                            anchor_text = ""
-
-                    matched_name = _clean_candidate_name(anchor_text)
-                    if _is_noisy_candidate_name(matched_name):
-                        continue
-
-                    try:
-                        snippet = (
-                            anchor.evaluate(
-                                "(el) => ((el.closest('li,article,section,div') || el.parentElement)?.innerText || '').replace(/\\s+/g, ' ').trim().slice(0, 180)"
-                            )
-                            or ""
-                        ).strip()
-                    except Exception:
-                        snippet = ""
-
-                    candidate_x = _extract_coord_from_href(resolved_href, "x")
-                    candidate_y = _extract_coord_from_href(resolved_href, "y")
-                    if candidate_x is None:
-                        candidate_x = _extract_coord_from_href(resolved_href, "lng")
-                    if candidate_y is None:
-                        candidate_y = _extract_coord_from_href(resolved_href, "lat")
-                    if (candidate_x is None or candidate_y is None) and naver_place_id in route_coord_lookup:
-                        route_x, route_y = route_coord_lookup[naver_place_id]
-                        if candidate_x is None:
-                            candidate_x = route_x
-                        if candidate_y is None:
-                            candidate_y = route_y
-
-                    current_candidate = {
-                        "naver_place_id": naver_place_id,
-                        "matched_name": matched_name,
-                        "x": candidate_x,
-                        "y": candidate_y,
-                        "snippet": snippet or None,
-                        "source_url": target_url,
-                    }
-                    existing = candidates.get(naver_place_id)
-                    if existing is None:
-                        candidates[naver_place_id] = current_candidate
+    best_name_score = 0.0
+    json_responses, on_response = _capture_place_json_responses(page)
+    try:
+        for query in normalized_queries:
+            query_new_candidates = 0
+            for template in MAPPING_URLS:
+                target_url = template.format(query=quote_plus(query))
+                json_responses.clear()
+                if not _safe_goto(page, target_url, timeout_ms=config.timeout_ms):
+                    continue
+
+                _paced_wait(page, config, multiplier=0.8)
+                for current_candidate in _json_mapping_candidates(json_responses, target_url):
+                    if _merge_mapping_candidate(candidates, current_candidate, place_name):
                         query_new_candidates += 1
-                    else:
-                        existing_score = _name_similarity(place_name, existing.get("matched_name"))
-                        current_score = _name_similarity(place_name, current_candidate.get("matched_name"))
-                        has_coord_upgrade = (
-                            (existing.get("x") is None or existing.get("y") is None)
-                            and current_candidate.get("x") is not None
-                            and current_candidate.get("y") is not None
-                        )
-                        has_better_snippet = not existing.get("snippet") and current_candidate.get("snippet")
-                        if current_score > existing_score or has_coord_upgrade or has_better_snippet:
-                            candidates[naver_place_id] = current_candidate
-
                     if len(candidates) >= discovery_limit:
                         break
+
+                if len(candidates) < discovery_limit:
+                    query_new_candidates += _extract_anchor_mapping_candidates(
+                        page,
+                        place_name,
+                        config,
+                        target_url,
+                        candidates,
+                        anchor_limit=max(24, target_limit * 10),
+                        discovery_limit=discovery_limit,
+                    )
+
+                logger.info(
+                    "naver.mapping.search_iter query=%s url=%s candidates=%s query_new=%s",
+                    query,
+                    target_url,
+                    len(candidates),
+                    query_new_candidates,
+                )
                 if len(candidates) >= discovery_limit:
                     break
+                best_name_score = max(
+                    (_name_similarity(place_name, candidate.get("matched_name")) for candidate in candidates.values()),
+                    default=0.0,
+                )
+                if best_name_score >= MAPPING_EARLY_EXIT_NAME_SCORE:
+                    logger.info(
+                        "naver.mapping.search_early_exit query=%s url=%s candidates=%s name_score=%.4f",
+                        query,
+                        target_url,
+                        len(candidates),
+                        best_name_score,
+                    )
+                    break
+            if len(candidates) >= discovery_limit or best_name_score >= MAPPING_EARLY_EXIT_NAME_SCORE:
+                break
+    finally:
+        try:
+            page.remove_listener("response", on_response)
+        except Exception:
+            pass
 
-            logger.info(
-                "naver.mapping.search_iter query=%s url=%s candidates=%s query_new=%s",
-                query,
-                target_url,
-                len(candidates),
-                query_new_candidates,
+    return list(candidates.values())[:discovery_limit]
+
+
+def _extract_anchor_mapping_candidates(
+    page: Page,
+    place_name: str,
+    config: NaverCrawlerConfig,
+    target_url: str,
+    candidates: dict[str, dict[str, Any]],
+    *,
+    anchor_limit: int,
+    discovery_limit: int,
+) -> int:
+    """DOM fallback: walk place anchors on the results page; returns the count of new ids."""
+    new_candidates = 0
+    route_coord_lookup = _extract_route_coord_lookup(page, config)
+
+    for selector in (
+        "a[href*='m.place.naver.com/place/']",
+        "a[href*='pcmap.place.naver.com/restaurant/']",
+        "a[href*='entry/place/']",
+        "a[href*='/place/']",
+    ):
+        try:
+            anchors = _page_locator(page, selector).evaluate_all(
+                MAPPING_ANCHORS_SCRIPT,
+                [anchor_limit, NOISY_MAPPING_NAME_UNION.pattern],
             )
+        except Exception:
+            anchors = []
+
+        for anchor in anchors:
+            href = anchor.get("href")
+            if not href:
+                continue
+
+            resolved_href = urljoin(page.url, href)
+            if "/place/list" in resolved_href:
+                continue
+            if "/photo" in urlparse(resolved_href).path:
+                continue
+
+            naver_place_id = _parse_place_id(resolved_href)
+            if not naver_place_id:
+                continue
+
+            # Already cleaned and noise-filtered in MAPPING_ANCHORS_SCRIPT.
+            matched_name = anchor.get("name") or ""
+            if not matched_name:
+                continue
+
+            snippet = (anchor.get("snippet") or "").strip()
+
+            candidate_x = _extract_coord_from_href(resolved_href, "x")
+            candidate_y = _extract_coord_from_href(resolved_href, "y")
+            if candidate_x is None:
+                candidate_x = _extract_coord_from_href(resolved_href, "lng")
+            if candidate_y is None:
+                candidate_y = _extract_coord_from_href(resolved_href, "lat")
+            if (candidate_x is None or candidate_y is None) and naver_place_id in route_coord_lookup:
+                route_x, route_y = route_coord_lookup[naver_place_id]
+                if candidate_x is None:
+                    candidate_x = route_x
+                if candidate_y is None:
+                    candidate_y = route_y
+
+            current_candidate = {
+                "naver_place_id": naver_place_id,
+                "matched_name": matched_name,
+                "x": candidate_x,
+                "y": candidate_y,
+                "snippet": snippet or None,
+                "source_url": target_url,
+            }
+            if _merge_mapping_candidate(candidates, current_candidate, place_name):
+                new_candidates += 1
+
             if len(candidates) >= discovery_limit:
-                break
-        if len(candidates) >= discovery_limit:
-            break
+                return new_candidates
 
-    return list(candidates.values())[:discovery_limit]
+    return new_candidates
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    # Compact separators so the fallback emits the same bytes as orjson.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class _MappingCache:
+    """TTL cache of MAPPED kakao -> naver payloads, shared across workers via Redis when
+    REDIS_URL is set and kept in-process otherwise (or after a Redis error).
+
+    Unresolved payloads are never stored, so a failed lookup is retried on the next crawl.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_client: Any = None
+        self._redis_checked = False
+
+    @staticmethod
+    def key(kakao_place_id: str, place_name: str | None, x: float | None, y: float | None) -> str:
+        coords = ":".join(
+            "-" if value is None else f"{value:.4f}" for value in (_to_optional_float(x), _to_optional_float(y))
+        )
+        return f"naver:mapping:v1:{kakao_place_id}:{(place_name or '').strip()}:{coords}"
+
+    def _redis(self) -> Any:
+        if not self._redis_checked:
+            self._redis_checked = True
+            redis_url = os.getenv("REDIS_URL")
+            if redis is not None and redis_url:
+                try:
+                    self._redis_client = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+                except Exception:
+                    logger.warning("naver.mapping.cache_redis_unavailable", exc_info=True)
+        return self._redis_client
+
+    def _disable_redis(self) -> None:
+        logger.warning("naver.mapping.cache_redis_error; using the in-process cache", exc_info=True)
+        self._redis_client = None
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        client = self._redis()
+        if client is not None:
+            try:
+                raw = client.get(key)
+                return _json_loads(raw) if raw else None
+            except Exception:
+                self._disable_redis()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(payload)
+
+    def put(self, key: str, payload: dict[str, Any], ttl_sec: int) -> None:
+        if ttl_sec <= 0 or payload.get("status") != "MAPPED":
+            return
+        client = self._redis()
+        if client is not None:
+            try:
+                client.setex(key, ttl_sec, _json_dumps(payload))
+                return
+            except Exception:
+                self._disable_redis()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_sec, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_MAPPING_CACHE = _MappingCache(max_entries=50_000)
 
 
 def resolve_naver_place_mapping(
@@ -1377,9 +2434,41 @@ def resolve_naver_place_mapping(
     x: float | None = None,
     y: float | None = None,
     *,
+    kakao_context: dict[str, Any] | None = None,
     _config: NaverCrawlerConfig | None = None,
 ) -> dict[str, Any]:
     config = _config or _load_config()
+    if config.mapping_cache_ttl_sec <= 0 or not place_name or not place_name.strip():
+        return _resolve_naver_place_mapping_uncached(
+            kakao_place_id, place_name, x, y, kakao_context=kakao_context, config=config
+        )
+
+    cache_key = _MappingCache.key(kakao_place_id, place_name, x, y)
+    cached = _MAPPING_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info(
+            "naver.mapping.cache_hit kakao_place_id=%s naver_place_id=%s",
+            kakao_place_id,
+            cached.get("naver_place_id"),
+        )
+        return cached
+
+    payload = _resolve_naver_place_mapping_uncached(
+        kakao_place_id, place_name, x, y, kakao_context=kakao_context, config=config
+    )
+    _MAPPING_CACHE.put(cache_key, payload, config.mapping_cache_ttl_sec)
+    return payload
+
+
+def _resolve_naver_place_mapping_uncached(
+    kakao_place_id: str,
+    place_name: str | None,
+    x: float | None,
+    y: float | None,
+    *,
+    kakao_context: dict[str, Any] | None,
+    config: NaverCrawlerConfig,
+) -> dict[str, Any]:
     payload = _safe_build_mapping_payload(kakao_place_id, place_name, x, y)
 
     if not place_name or not place_name.strip():
@@ -1393,13 +2482,14 @@ def resolve_naver_place_mapping(
 
     session: BrowserSession | None = None
     try:
-        kakao_context = _fetch_kakao_place_context(
-            kakao_place_id=kakao_place_id,
-            place_name=place_name,
-            x=x,
-            y=y,
-            config=config,
-        )
+        if kakao_context is None:
+            kakao_context = _fetch_kakao_place_context(
+                kakao_place_id=kakao_place_id,
+                place_name=place_name,
+                x=x,
+                y=y,
+                config=config,
+            )
         resolved_place_name = str(kakao_context.get("place_name") or place_name or "").strip()
         resolved_x = _to_optional_float(kakao_context.get("x"))
         resolved_y = _to_optional_float(kakao_context.get("y"))
@@ -1453,7 +2543,7 @@ def resolve_naver_place_mapping(
         payload["confidence"] = best_candidate["confidence"]
         payload["distance_m"] = best_candidate.get("distance_m")
         payload["matched_name"] = best_candidate["matched_name"]
-        payload["top_candidates"] = scored_candidates[:3]
+        payload["top_candidates"] = scored_candidates[:MAPPING_TOP_CANDIDATE_LIMIT]
 
         if best_candidate["confidence"] < MAP_MIN_CONFIDENCE:
             payload["reason"] = "low_confidence"
@@ -1497,27 +2587,24 @@ def resolve_naver_place_mapping(
         )
         return payload
     finally:
-        _close_browser_session(session)
+        _close_browser_session(session, config)
 
 
 def _extract_reviews(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
     extracted: list[dict[str, Any]] = []
+    now = _utc_now_naive()
 
     for selector in REVIEW_ITEM_SELECTORS:
         try:
-            locator = page.locator(selector)
-            count = min(locator.count(), 500)
+            items = _page_locator(page, selector).evaluate_all(
+                REVIEW_ITEMS_SCRIPT,
+                [500, REVIEW_CONTENT_SELECTORS, REVIEW_AUTHOR_SELECTORS, REVIEW_DATE_SELECTORS],
+            )
         except Exception:
-            count = 0
-
-        if count <= 0:
             continue
 
-        for index in range(count):
-            item = locator.nth(index)
-            review_id = _extract_attr(item, ["data-review-id", "data-id", "id"])
-
-            content = _extract_text(item, REVIEW_CONTENT_SELECTORS)
+        for item in items:
+            content = item.get("content")
             if not content:
                 continue
 
@@ -1525,16 +2612,15 @@ def _extract_reviews(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
             if not content or len(content) < 2:
                 continue
 
-            author = _extract_text(item, REVIEW_AUTHOR_SELECTORS)
-            posted_at = _extract_text(item, REVIEW_DATE_SELECTORS)
+            posted_at = item.get("posted_at")
 
             extracted.append(
                 {
-                    "review_id": review_id,
+                    "review_id": item.get("review_id"),
                     "content": content,
-                    "author": author,
+                    "author": item.get("author"),
                     "posted_at": posted_at,
-                    "posted_at_iso": _parse_posted_at_iso(posted_at),
+                    "posted_at_iso": _parse_posted_at_iso(posted_at, now=now),
                     "naver_place_id": naver_place_id,
                 }
             )
@@ -1542,13 +2628,56 @@ def _extract_reviews(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
     return extracted
 
 
+def _review_item_count(page: Page) -> int | None:
+    try:
+        return int(_page_locator(page, REVIEW_ITEMS_SELECTOR).count())
+    except Exception:
+        return None
+
+
+class _TemplateHintCache:
+    """Process-local LRU of which URL template index last opened for a Naver place id.
+
+    REVIEW_URLS and PHOTO_URLS list the same host families in the same order, so one hint
+    serves both (and repeat crawls of the place) and skips navigations that will be rejected.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._hints: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def order(self, naver_place_id: str, templates: list[str]) -> list[str]:
+        with self._lock:
+            index = self._hints.get(naver_place_id)
+            if index is not None:
+                self._hints.move_to_end(naver_place_id)
+        if index is None or not 0 < index < len(templates):
+            return templates
+        return [templates[index], *templates[:index], *templates[index + 1 :]]
+
+    def record(self, naver_place_id: str, templates: list[str], template: str | None) -> None:
+        with self._lock:
+            if template is None:
+                self._hints.pop(naver_place_id, None)
+                return
+            self._hints[naver_place_id] = templates.index(template)
+            self._hints.move_to_end(naver_place_id)
+            while len(self._hints) > self.max_entries:
+                self._hints.popitem(last=False)
+
+
+_URL_TEMPLATE_HINTS = _TemplateHintCache(max_entries=10_000)
+
+
 def _crawl_reviews_with_page(
     page: Page,
     naver_place_id: str,
     config: NaverCrawlerConfig,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     selected_url = None
-    for template in REVIEW_URLS:
+    selected_template = None
+    for template in _URL_TEMPLATE_HINTS.order(naver_place_id, REVIEW_URLS):
         candidate_url = template.format(place_id=naver_place_id)
         if _safe_goto(page, candidate_url, timeout_ms=config.timeout_ms):
             _paced_wait(page, config, multiplier=0.8)
@@ -1560,8 +2689,10 @@ def _crawl_reviews_with_page(
                 )
                 continue
             selected_url = candidate_url
+            selected_template = template
             break
 
+    _URL_TEMPLATE_HINTS.record(naver_place_id, REVIEW_URLS, selected_template)
     if not selected_url:
         logger.warning("naver.review.open_failed naver_place_id=%s", naver_place_id)
         return [], {}
@@ -1570,8 +2701,11 @@ def _crawl_reviews_with_page(
     _paced_wait(page, config)
     rating_summary = _extract_rating_summary(page)
 
-    collected = _dedupe_reviews(_safe_extract(lambda: _extract_reviews(page, naver_place_id), action_name="review_extract"))
+    # Merge each extraction into one map instead of re-deduping the whole collection per click.
+    collected: dict[Any, dict[str, Any]] = {}
+    _merge_reviews(collected, _safe_extract(lambda: _extract_reviews(page, naver_place_id), action_name="review_extract"))
     guard = _NoGrowthGuard(config.no_growth_limit, baseline=len(collected))
+    review_item_count = _review_item_count(page)
 
     logger.info(
         "naver.review.start naver_place_id=%s initial_count=%s max_clicks=%s no_growth_limit=%s",
@@ -1597,9 +2731,16 @@ def _crawl_reviews_with_page(
             )
             break
 
-        _paced_wait(page, config)
-        latest = _dedupe_reviews(_safe_extract(lambda: _extract_reviews(page, naver_place_id), action_name="review_extract"))
-        collected = _dedupe_reviews([*collected, *latest])
+        _wait_for_count_increase(page, REVIEW_ITEMS_SELECTOR, review_item_count, config)
+        latest_item_count = _review_item_count(page)
+        added = 0
+        # No new review nodes since the last extraction means nothing new to merge.
+        if latest_item_count is None or latest_item_count != review_item_count:
+            review_item_count = latest_item_count
+            added = _merge_reviews(
+                collected,
+                _safe_extract(lambda: _extract_reviews(page, naver_place_id), action_name="review_extract"),
+            )
         current_count = len(collected)
 
         logger.info(
@@ -1609,7 +2750,7 @@ def _crawl_reviews_with_page(
             current_count,
         )
 
-        if guard.observe(current_count):
+        if guard.observe_delta(added):
             logger.info(
                 "naver.review.stop naver_place_id=%s reason=no_growth click_iteration=%s count=%s",
                 naver_place_id,
@@ -1625,7 +2766,7 @@ def _crawl_reviews_with_page(
         rating_summary.get("average_rating"),
         rating_summary.get("rating_count"),
     )
-    return collected, rating_summary
+    return list(collected.values()), rating_summary
 
 
 def _extract_photos(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
@@ -1638,17 +2779,12 @@ def _extract_photos(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
         if len(extracted) >= max_total:
             break
         try:
-            locator = page.locator(selector)
-            count = min(locator.count(), 40)
+            images = _page_locator(page, selector).evaluate_all(PHOTO_ITEMS_SCRIPT, 40)
         except Exception:
-            count = 0
+            images = []
 
-        for index in range(count):
-            image = locator.nth(index)
-            image_url = _extract_attr(
-                image,
-                ["src", "data-src", "data-original", "data-lazy-src", "data-image-src"],
-            )
+        for image in images:
+            image_url = image.get("image_url")
             if not image_url or image_url.startswith("data:"):
                 continue
 
@@ -1657,8 +2793,8 @@ def _extract_photos(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
                 continue
             seen_urls.add(normalized_key)
 
-            alt = _extract_attr(image, ["alt"])
-            title = _extract_attr(image, ["title"])
+            alt = image.get("alt")
+            title = image.get("title")
             captured_at = None
 
             extracted.append(
@@ -1680,15 +2816,79 @@ def _extract_photos(page: Page, naver_place_id: str) -> list[dict[str, Any]]:
     return extracted
 
 
+def _prefetch_photo_page(
+    session: BrowserSession,
+    naver_place_id: str,
+    config: NaverCrawlerConfig,
+) -> tuple[Page | None, str | None]:
+    """Start loading the first photo URL in a second tab while reviews run on the main one.
+
+    The sync API is single-threaded, so instead of a worker thread this navigates with
+    wait_until="commit": goto returns once the response starts and the browser finishes
+    loading the tab in the background.
+    """
+    if not config.photo_prefetch:
+        return None, None
+    try:
+        page = session.context.new_page()
+        page.set_default_timeout(config.timeout_ms)
+    except Exception:
+        logger.warning("naver.photo.prefetch_page_failed naver_place_id=%s", naver_place_id, exc_info=True)
+        return None, None
+
+    prefetch_url = _URL_TEMPLATE_HINTS.order(naver_place_id, PHOTO_URLS)[0].format(place_id=naver_place_id)
+    try:
+        page.goto(prefetch_url, wait_until="commit", timeout=config.timeout_ms)
+    except Exception:
+        logger.info("naver.photo.prefetch_failed naver_place_id=%s url=%s", naver_place_id, prefetch_url)
+        return page, None
+    return page, prefetch_url
+
+
+def _await_prefetched_page(page: Page, config: NaverCrawlerConfig) -> bool:
+    try:
+        if page.url in ("", "about:blank"):
+            return False
+        page.wait_for_load_state("domcontentloaded", timeout=config.timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+def _jump_last_photo(page: Page) -> bool:
+    """Scroll the last grid photo to the top of the viewport to trigger the lazy loader."""
+    try:
+        return int(page.evaluate(PHOTO_JUMP_SCRIPT, PHOTO_ITEMS_SELECTOR) or 0) > 0
+    except Exception:
+        return False
+
+
+def _photo_grid_signature(page: Page) -> tuple[int, str, int] | None:
+    try:
+        item_count, last_src, placeholder_count = page.evaluate(PHOTO_GRID_SIGNATURE_SCRIPT, PHOTO_ITEMS_SELECTOR)
+        return int(item_count), str(last_src or ""), int(placeholder_count)
+    except Exception:
+        return None
+
+
 def _crawl_photos_with_page(
     page: Page,
     naver_place_id: str,
     config: NaverCrawlerConfig,
+    *,
+    prefetched_url: str | None = None,
 ) -> list[dict[str, Any]]:
     selected_url = None
-    for template in PHOTO_URLS:
+    selected_template = None
+    for template in _URL_TEMPLATE_HINTS.order(naver_place_id, PHOTO_URLS):
         candidate_url = template.format(place_id=naver_place_id)
-        if _safe_goto(page, candidate_url, timeout_ms=config.timeout_ms):
+        if candidate_url == prefetched_url and _await_prefetched_page(page, config):
+            opened = True
+        else:
+            # Once the tab navigates away, the prefetched load no longer applies.
+            prefetched_url = None
+            opened = _safe_goto(page, candidate_url, timeout_ms=config.timeout_ms)
+        if opened:
             _paced_wait(page, config, multiplier=0.8)
             if _is_unusable_content_page(page):
                 logger.info(
@@ -1698,8 +2898,10 @@ def _crawl_photos_with_page(
                 )
                 continue
             selected_url = candidate_url
+            selected_template = template
             break
 
+    _URL_TEMPLATE_HINTS.record(naver_place_id, PHOTO_URLS, selected_template)
     if not selected_url:
         logger.warning("naver.photo.open_failed naver_place_id=%s", naver_place_id)
         return []
@@ -1707,8 +2909,10 @@ def _crawl_photos_with_page(
     _safe_click(page, PHOTO_TAB_SELECTORS, timeout_ms=config.timeout_ms, action_name="photo_open_tab")
     _paced_wait(page, config)
 
-    collected = _dedupe_photos(_safe_extract(lambda: _extract_photos(page, naver_place_id), action_name="photo_extract"))
+    collected: dict[str, dict[str, Any]] = {}
+    _merge_photos(collected, _safe_extract(lambda: _extract_photos(page, naver_place_id), action_name="photo_extract"))
     guard = _NoGrowthGuard(config.no_growth_limit, baseline=len(collected))
+    grid_signature = _photo_grid_signature(page)
 
     logger.info(
         "naver.photo.start naver_place_id=%s initial_count=%s max_scrolls=%s no_growth_limit=%s",
@@ -1719,7 +2923,7 @@ def _crawl_photos_with_page(
     )
 
     for scroll_index in range(1, config.photo_max_scrolls + 1):
-        if not _safe_scroll(page, 1800, action_name=f"photo_scroll_{scroll_index}"):
+        if not _jump_last_photo(page) and not _safe_scroll(page, 1800, action_name=f"photo_scroll_{scroll_index}"):
             logger.info(
                 "naver.photo.stop naver_place_id=%s reason=scroll_failed iteration=%s count=%s",
                 naver_place_id,
@@ -1728,9 +2932,21 @@ def _crawl_photos_with_page(
             )
             break
 
-        _paced_wait(page, config)
-        latest = _dedupe_photos(_safe_extract(lambda: _extract_photos(page, naver_place_id), action_name="photo_extract"))
-        collected = _dedupe_photos([*collected, *latest])
+        _wait_for_count_increase(
+            page,
+            PHOTO_ITEMS_SELECTOR,
+            grid_signature[0] if grid_signature is not None else None,
+            config,
+        )
+        latest_signature = _photo_grid_signature(page)
+        # An unchanged grid signature means re-extracting would only return known photos.
+        added = 0
+        if latest_signature is None or latest_signature != grid_signature:
+            grid_signature = latest_signature
+            added = _merge_photos(
+                collected,
+                _safe_extract(lambda: _extract_photos(page, naver_place_id), action_name="photo_extract"),
+            )
         current_count = len(collected)
 
         logger.info(
@@ -1740,7 +2956,7 @@ def _crawl_photos_with_page(
             current_count,
         )
 
-        if guard.observe(current_count):
+        if guard.observe_delta(added):
             logger.info(
                 "naver.photo.stop naver_place_id=%s reason=no_growth iteration=%s count=%s",
                 naver_place_id,
@@ -1754,26 +2970,50 @@ def _crawl_photos_with_page(
         naver_place_id,
         len(collected),
     )
-    return collected
+    return list(collected.values())
+
+
+@dataclass(slots=True)
+class NaverCrawlResult:
+    mapping: dict[str, Any]
+    status: str
+    skip_reason: str | None
+    reviews: list[dict[str, Any]] = field(default_factory=list)
+    photos: list[dict[str, Any]] = field(default_factory=list)
+    rating_summary: dict[str, Any] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Bundle dict returned by the public API; ``warnings`` only appears when non-empty."""
+        payload: dict[str, Any] = {
+            "mapping": self.mapping,
+            "status": self.status,
+            "skip_reason": self.skip_reason,
+            "reviews": self.reviews,
+            "photos": self.photos,
+            "rating_summary": self.rating_summary,
+        }
+        if self.warnings:
+            payload["warnings"] = self.warnings
+        return payload
 
 
-def crawl_naver_place_bundle(
+def _crawl_naver_place_result(
     kakao_place_id: str,
     place_name: str | None,
     x: float | None = None,
     y: float | None = None,
-) -> dict[str, Any]:
+    kakao_context: dict[str, Any] | None = None,
+) -> NaverCrawlResult:
     config = _load_config()
-    mapping = resolve_naver_place_mapping(kakao_place_id, place_name, x=x, y=y, _config=config)
-
-    result: dict[str, Any] = {
-        "mapping": mapping,
-        "status": "SKIPPED" if not mapping.get("crawlable") else "COMPLETED",
-        "skip_reason": mapping.get("reason"),
-        "reviews": [],
-        "photos": [],
-        "rating_summary": {},
-    }
+    mapping = resolve_naver_place_mapping(
+        kakao_place_id,
+        place_name,
+        x=x,
+        y=y,
+        kakao_context=kakao_context,
+        _config=config,
+    )
 
     if not mapping.get("crawlable"):
         logger.info(
@@ -1782,60 +3022,65 @@ def crawl_naver_place_bundle(
             place_name,
             mapping.get("reason"),
         )
-        return result
+        return NaverCrawlResult(mapping=mapping, status="SKIPPED", skip_reason=mapping.get("reason"))
 
     naver_place_id = mapping.get("naver_place_id")
     if not naver_place_id:
-        result["status"] = "SKIPPED"
-        result["skip_reason"] = "missing_naver_place_id"
-        return result
+        return NaverCrawlResult(mapping=mapping, status="SKIPPED", skip_reason="missing_naver_place_id")
 
+    result = NaverCrawlResult(mapping=mapping, status="COMPLETED", skip_reason=mapping.get("reason"))
     session: BrowserSession | None = None
-    warnings: list[str] = []
+    photo_page: Page | None = None
     try:
         session = _create_browser_session(config)
+        photo_page, prefetched_url = _prefetch_photo_page(session, naver_place_id, config)
 
         try:
-            reviews, rating_summary = _crawl_reviews_with_page(session.page, naver_place_id, config)
-            result["reviews"] = reviews
-            result["rating_summary"] = rating_summary
+            result.reviews, result.rating_summary = _crawl_reviews_with_page(session.page, naver_place_id, config)
         except Exception as exc:
-            warnings.append(f"review_error:{exc}")
+            result.warnings.append(f"review_error:{exc}")
             logger.warning(
                 "naver.review.error kakao_place_id=%s naver_place_id=%s",
                 kakao_place_id,
                 naver_place_id,
                 exc_info=True,
             )
-            result["reviews"] = []
-            result["rating_summary"] = {}
+            result.reviews = []
+            result.rating_summary = {}
 
         try:
-            result["photos"] = _crawl_photos_with_page(session.page, naver_place_id, config)
+            result.photos = _crawl_photos_with_page(
+                photo_page or session.page,
+                naver_place_id,
+                config,
+                prefetched_url=prefetched_url,
+            )
         except Exception as exc:
-            warnings.append(f"photo_error:{exc}")
+            result.warnings.append(f"photo_error:{exc}")
             logger.warning(
                 "naver.photo.error kakao_place_id=%s naver_place_id=%s",
                 kakao_place_id,
                 naver_place_id,
                 exc_info=True,
             )
-            result["photos"] = []
+            result.photos = []
 
-        if warnings:
-            result["status"] = "PARTIAL"
-            result["warnings"] = warnings
+        if result.warnings:
+            result.status = "PARTIAL"
 
-        logger.info(
-            "naver.crawl.done kakao_place_id=%s naver_place_id=%s review_count=%s photo_count=%s rating=%s rating_count=%s status=%s",
-            kakao_place_id,
-            naver_place_id,
-            len(result["reviews"]),
-            len(result["photos"]),
-            result.get("rating_summary", {}).get("average_rating"),
-            result.get("rating_summary", {}).get("rating_count"),
-            result["status"],
-        )
+        # Skip building the summary arguments entirely when INFO is filtered out.
+        if logger.isEnabledFor(logging.INFO):
+            rating_summary = result.rating_summary
+            logger.info(
+                "naver.crawl.done kakao_place_id=%s naver_place_id=%s review_count=%s photo_count=%s rating=%s rating_count=%s status=%s",
+                kakao_place_id,
+                naver_place_id,
+                len(result.reviews),
+                len(result.photos),
+                rating_summary.get("average_rating"),
+                rating_summary.get("rating_count"),
+                result.status,
+            )
         return result
     except Exception as exc:
         logger.warning(
@@ -1845,12 +3090,352 @@ def crawl_naver_place_bundle(
             str(exc),
             exc_info=True,
         )
-        result["status"] = "SKIPPED"
-        result["skip_reason"] = "crawler_error"
-        result["warnings"] = [f"crawler_error:{exc}"]
+        result.status = "SKIPPED"
+        result.skip_reason = "crawler_error"
+        result.warnings = [f"crawler_error:{exc}"]
         return result
     finally:
-        _close_browser_session(session)
+        if photo_page is not None:
+            try:
+                photo_page.close()
+            except Exception:
+                logger.warning("naver.cleanup.photo_page_close_failed", exc_info=True)
+        _close_browser_session(session, config)
+
+
+def crawl_naver_place_bundle(
+    kakao_place_id: str,
+    place_name: str | None,
+    x: float | None = None,
+    y: float | None = None,
+    kakao_context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Map and crawl one place; use bundle_to_json() when the result is shipped as JSON."""
+    return _crawl_naver_place_result(
+        kakao_place_id,
+        place_name,
+        x=x,
+        y=y,
+        kakao_context=kakao_context,
+    ).to_dict()
+
+
+def bundle_to_json(result: dict[str, Any] | NaverCrawlResult) -> bytes:
+    """Encode a bundle (dict or NaverCrawlResult) straight to UTF-8 JSON bytes.
+
+    Uses orjson when installed, which skips the intermediate str of json.dumps on the
+    review/photo lists; NaverCrawlResult goes through to_dict() to keep the bundle shape.
+    """
+    if isinstance(result, NaverCrawlResult):
+        result = result.to_dict()
+    return _json_dumps(result)
+
+
+_BUNDLE_EXECUTOR: ThreadPoolExecutor | None = None
+_BUNDLE_EXECUTOR_WORKERS = 0
+_BUNDLE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _bundle_executor() -> ThreadPoolExecutor:
+    """Process-wide crawl threads, so each keeps its thread-bound browser pool warm across batches.
+
+    Sized once, on first use, to the configured concurrency ceiling and never rebuilt:
+    a dropped thread would strand its Chromium, which sync Playwright can only close
+    from that same thread.
+    """
+    global _BUNDLE_EXECUTOR, _BUNDLE_EXECUTOR_WORKERS
+    with _BUNDLE_EXECUTOR_LOCK:
+        if _BUNDLE_EXECUTOR is None:
+            config = _load_config()
+            _BUNDLE_EXECUTOR_WORKERS = max(1, config.bundle_concurrency, config.bundle_max_concurrency)
+            _BUNDLE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_BUNDLE_EXECUTOR_WORKERS,
+                thread_name_prefix="naver-crawl",
+            )
+        return _BUNDLE_EXECUTOR
+
+
+def _failed_crawl_result(place: dict[str, Any], exc: BaseException) -> NaverCrawlResult:
+    return NaverCrawlResult(
+        mapping=_safe_build_mapping_payload(
+            str(place.get("kakao_place_id") or ""),
+            place.get("place_name"),
+            _to_optional_float(place.get("x")),
+            _to_optional_float(place.get("y")),
+        ),
+        status="SKIPPED",
+        skip_reason="crawler_error",
+        warnings=[f"crawler_error:{exc}"],
+    )
+
+
+def _unique_places(places: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    unique: dict[str, dict[str, Any]] = {}
+    for place in places:
+        kakao_place_id = str(place.get("kakao_place_id") or "").strip()
+        if kakao_place_id and kakao_place_id not in unique:
+            unique[kakao_place_id] = place
+    return unique
+
+
+class _AdaptiveLimiter:
+    """AIMD concurrency gate for the batch crawl, shared by the crawl threads.
+
+    A place that ends in an error or a partial crawl (timeouts, blocked pages) halves the
+    limit; every ``increase_after`` clean places in a row open one more slot, up to
+    ``maximum``. In-flight crawls are never cancelled; a lowered limit only holds back
+    new ones.
+    """
+
+    def __init__(self, initial: int, maximum: int, increase_after: int = 5) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = min(max(1, initial), self.maximum)
+        self.increase_after = max(1, increase_after)
+        self.in_flight = 0
+        self.successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    def release(self, ok: bool) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if ok:
+                self.successes += 1
+                if self.successes >= self.increase_after and self.limit < self.maximum:
+                    self.limit += 1
+                    self.successes = 0
+            else:
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+            self._condition.notify_all()
+
+
+def _is_degraded_crawl(result: NaverCrawlResult) -> bool:
+    # Signals that Naver (or the browser) is struggling, not that the place is unmappable.
+    return (
+        result.status == "PARTIAL"
+        or result.skip_reason == "crawler_error"
+        or result.mapping.get("reason") == "search_error"
+    )
+
+
+def _crawl_place_limited(
+    limiter: _AdaptiveLimiter,
+    kakao_place_id: str,
+    place: dict[str, Any],
+) -> NaverCrawlResult:
+    limiter.acquire()
+    ok = False
+    try:
+        result = _crawl_naver_place_result(
+            kakao_place_id,
+            place.get("place_name"),
+            x=_to_optional_float(place.get("x")),
+            y=_to_optional_float(place.get("y")),
+            kakao_context=place.get("kakao_context"),
+        )
+        ok = not _is_degraded_crawl(result)
+        return result
+    finally:
+        limiter.release(ok)
+
+
+def _submit_place_crawls(
+    unique_places: dict[str, dict[str, Any]],
+    concurrency: int | None,
+) -> list[Future[NaverCrawlResult]]:
+    """Queue one crawl per place on the bundle executor behind a fresh _AdaptiveLimiter.
+
+    The limiter never allows more than the executor has threads; a larger requested
+    ``concurrency`` is clamped instead of growing the pool.
+    """
+    config = _load_config()
+    executor = _bundle_executor()
+    ceiling = _BUNDLE_EXECUTOR_WORKERS
+    initial = min(max(1, concurrency or config.bundle_concurrency), ceiling)
+    limiter = _AdaptiveLimiter(initial, min(max(initial, config.bundle_max_concurrency), ceiling))
+    return [
+        executor.submit(_crawl_place_limited, limiter, kakao_place_id, place)
+        for kakao_place_id, place in unique_places.items()
+    ]
+
+
+def _collect_place_crawls(
+    unique_places: dict[str, dict[str, Any]],
+    outcomes: list[NaverCrawlResult | BaseException],
+) -> dict[str, NaverCrawlResult]:
+    results: dict[str, NaverCrawlResult] = {}
+    for (kakao_place_id, place), outcome in zip(unique_places.items(), outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(
+                "naver.crawl.batch_error kakao_place_id=%s",
+                kakao_place_id,
+                exc_info=outcome,
+            )
+            outcome = _failed_crawl_result(place, outcome)
+        results[kakao_place_id] = outcome
+    return results
+
+
+def _crawl_naver_place_results(
+    unique_places: dict[str, dict[str, Any]],
+    concurrency: int | None,
+) -> dict[str, NaverCrawlResult]:
+    """Blocking batch crawl on the bundle executor; no event loop involved."""
+    if not unique_places:
+        return {}
+    futures = _submit_place_crawls(unique_places, concurrency)
+    # exception() blocks until the future is done; it is None only for a returned result.
+    return _collect_place_crawls(
+        unique_places,
+        [future.exception() or future.result() for future in futures],
+    )
+
+
+async def _crawl_naver_place_results_many(
+    unique_places: dict[str, dict[str, Any]],
+    concurrency: int | None,
+) -> dict[str, NaverCrawlResult]:
+    if not unique_places:
+        return {}
+    futures = _submit_place_crawls(unique_places, concurrency)
+    outcomes = await asyncio.gather(
+        *(asyncio.wrap_future(future) for future in futures),
+        return_exceptions=True,
+    )
+    return _collect_place_crawls(unique_places, outcomes)
+
+
+async def crawl_naver_place_bundle_many(
+    places: list[dict[str, Any]],
+    *,
+    concurrency: int | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Crawl several places concurrently; returns bundles keyed by kakao_place_id.
+
+    Each place is a dict with kakao_place_id, place_name, x, y and an optional
+    kakao_context. The blocking crawl runs on a dedicated thread pool (sync Playwright
+    is thread-bound) and an _AdaptiveLimiter caps how many places are in flight.
+    """
+    results = await _crawl_naver_place_results_many(_unique_places(places), concurrency)
+    return {kakao_place_id: result.to_dict() for kakao_place_id, result in results.items()}
+
+
+class _BundleCache:
+    """Process-local, short-TTL LRU of completed bundles keyed by the crawl arguments.
+
+    Backs crawl_naver_place_batch, so repeat lookups of a place (such as the deprecated
+    crawl_naver_reviews + crawl_naver_photos pair) share one browser crawl. Only
+    COMPLETED bundles are stored, so a skipped or partial crawl is retried next call.
+    Bundles are deep-copied in and out, so callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int, ttl_sec: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, NaverCrawlResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> NaverCrawlResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, bundle = entry
+            if time.monotonic() - stored_at > self.ttl_sec:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(bundle)
+
+    def put(self, key: tuple[Any, ...], bundle: NaverCrawlResult) -> None:
+        if bundle.status != "COMPLETED":
+            return
+        stored = copy.deepcopy(bundle)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def bust(self, kakao_place_id: str | None = None) -> None:
+        with self._lock:
+            if kakao_place_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == kakao_place_id]:
+                del self._entries[key]
+
+
+_BUNDLE_CACHE = _BundleCache(max_entries=512, ttl_sec=120.0)
+
+
+def bust_bundle_cache(kakao_place_id: str | None = None) -> None:
+    """Drop cached bundles for one place, or all of them when no id is given."""
+    _BUNDLE_CACHE.bust(kakao_place_id)
+
+
+def _bundle_cache_key(kakao_place_id: str, place: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        kakao_place_id,
+        place.get("place_name"),
+        _to_optional_float(place.get("x")),
+        _to_optional_float(place.get("y")),
+    )
+
+
+def crawl_naver_place_batch(
+    places: Iterable[dict[str, Any]],
+    *,
+    concurrency: int | None = None,
+) -> dict[str, NaverCrawlResult]:
+    """Blocking batch entry point: one full crawl per place, served from the bundle cache when fresh.
+
+    Places use the same dict shape as crawl_naver_place_bundle_many; misses are crawled
+    concurrently on the bundle executor and completed results are cached for the
+    follow-up lookups. No event loop is used, but the call blocks until every miss is
+    done, so async code should await crawl_naver_place_bundle_many instead.
+    """
+    unique_places = _unique_places(places)
+    results: dict[str, NaverCrawlResult] = {}
+    misses: dict[str, dict[str, Any]] = {}
+    for kakao_place_id, place in unique_places.items():
+        cached = _BUNDLE_CACHE.get(_bundle_cache_key(kakao_place_id, place))
+        if cached is None:
+            misses[kakao_place_id] = place
+        else:
+            results[kakao_place_id] = cached
+
+    if len(misses) == 1:
+        # Crawl a lone miss on the calling thread and skip the executor hop.
+        (kakao_place_id, place), = misses.items()
+        try:
+            crawled = {
+                kakao_place_id: _crawl_naver_place_result(
+                    kakao_place_id,
+                    place.get("place_name"),
+                    x=_to_optional_float(place.get("x")),
+                    y=_to_optional_float(place.get("y")),
+                    kakao_context=place.get("kakao_context"),
+                )
+            }
+        except Exception as exc:
+            logger.warning("naver.crawl.batch_error kakao_place_id=%s", kakao_place_id, exc_info=True)
+            crawled = {kakao_place_id: _failed_crawl_result(place, exc)}
+    elif misses:
+        crawled = _crawl_naver_place_results(misses, concurrency)
+    else:
+        crawled = {}
+
+    for kakao_place_id, result in crawled.items():
+        _BUNDLE_CACHE.put(_bundle_cache_key(kakao_place_id, misses[kakao_place_id]), result)
+    results.update(crawled)
+
+    return {kakao_place_id: results[kakao_place_id] for kakao_place_id in unique_places}
 
 
 def crawl_naver_reviews(
@@ -1859,8 +3444,13 @@ def crawl_naver_reviews(
     x: float | None = None,
     y: float | None = None,
 ) -> list[dict[str, Any]]:
-    bundle = crawl_naver_place_bundle(kakao_place_id=kakao_place_id, place_name=place_name, x=x, y=y)
-    return bundle.get("reviews", [])
+    warnings.warn(
+        "crawl_naver_reviews is deprecated; use crawl_naver_place_batch and read .reviews",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    place = {"kakao_place_id": kakao_place_id, "place_name": place_name, "x": x, "y": y}
+    return list(crawl_naver_place_batch([place], concurrency=1)[kakao_place_id].reviews)
 
 
 def crawl_naver_photos(
@@ -1869,13 +3459,27 @@ def crawl_naver_photos(
     x: float | None = None,
     y: float | None = None,
 ) -> list[dict[str, Any]]:
-    bundle = crawl_naver_place_bundle(kakao_place_id=kakao_place_id, place_name=place_name, x=x, y=y)
-    return bundle.get("photos", [])
+    warnings.warn(
+        "crawl_naver_photos is deprecated; use crawl_naver_place_batch and read .photos",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    place = {"kakao_place_id": kakao_place_id, "place_name": place_name, "x": x, "y": y}
+    return list(crawl_naver_place_batch([place], concurrency=1)[kakao_place_id].photos)
 
 
 __all__ = [
+    "NaverCrawlResult",
+    "batch_fetch_kakao_place_contexts",
+    "bundle_to_json",
+    "bust_bundle_cache",
     "crawl_naver_place_bundle",
+    "crawl_naver_place_batch",
+    "crawl_naver_place_bundle_many",
     "crawl_naver_reviews",
     "crawl_naver_photos",
+    "refresh_kakao_key",
     "resolve_naver_place_mapping",
+    "shutdown_browser_pools",
+    "warm_browser_pool",
 ]
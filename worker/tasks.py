@@ -7,12 +7,18 @@ from uuid import uuid4
 
 import psycopg2
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from psycopg2.extras import Json, RealDictCursor
 from pymongo import MongoClient
 from pymongo.errors import AutoReconnect, PyMongoError
 
 from crawlers.instagram import crawl_instagram_trend
-from crawlers.naver_place import crawl_naver_place_bundle
+from crawlers.naver_place import (
+    batch_fetch_kakao_place_contexts,
+    crawl_naver_place_batch,
+    shutdown_browser_pools,
+    warm_browser_pool,
+)
 
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO").upper(),
@@ -46,6 +52,17 @@ REVIEW_CAUTION_SIGNALS: dict[str, tuple[str, ...]] = {
 app = Celery("tasks", broker=BROKER_URL, backend=RESULT_BACKEND)
 
 
+@worker_process_init.connect
+def _warm_crawler_browser(**_kwargs: Any) -> None:
+    warm_browser_pool()
+
+
+@worker_process_shutdown.connect
+def _close_crawler_browser(**_kwargs: Any) -> None:
+    # Prefork children exit without running atexit hooks; close Chromium explicitly.
+    shutdown_browser_pools()
+
+
 def _normalize_text(value: Any) -> str:
     if value is None:
         return ""
@@ -485,19 +502,39 @@ def ingest_job(self, job_id: str) -> dict[str, Any]:
                 items = _get_job_items(cursor, job_id)
                 total_items = len(items)
 
+        # Kakao lookups are independent HTTP calls; overlap them before the browser work.
+        kakao_contexts = batch_fetch_kakao_place_contexts(items)
+
+        with pg_conn:
+            with pg_conn.cursor() as cursor:
+                for item in items:
+                    _set_item_status(cursor, str(item["id"]), "PROCESSING")
+
+        # One batch crawls the places concurrently; rows are still written item by item below.
+        crawl_error: Exception | None = None
+        try:
+            naver_results = crawl_naver_place_batch(
+                {
+                    "kakao_place_id": str(item["kakao_place_id"]),
+                    "place_name": item.get("place_name"),
+                    "x": item.get("x"),
+                    "y": item.get("y"),
+                    "kakao_context": kakao_contexts.get(str(item["kakao_place_id"])),
+                }
+                for item in items
+            )
+        except Exception as exc:
+            logger.exception("Naver batch crawl failed: job_id=%s", job_id)
+            naver_results = {}
+            crawl_error = exc
+
         for item in items:
             item_id = str(item["id"])
             try:
-                with pg_conn:
-                    with pg_conn.cursor() as cursor:
-                        _set_item_status(cursor, item_id, "PROCESSING")
-
-                naver_bundle = crawl_naver_place_bundle(
-                    kakao_place_id=item["kakao_place_id"],
-                    place_name=item.get("place_name"),
-                    x=item.get("x"),
-                    y=item.get("y"),
-                )
+                naver_result = naver_results.get(str(item["kakao_place_id"]).strip())
+                if naver_result is None:
+                    raise crawl_error or RuntimeError("naver crawl returned no result")
+                naver_bundle = naver_result.to_dict()
                 reviews = naver_bundle.get("reviews", [])
                 photos = naver_bundle.get("photos", [])
                 naver_mapping = naver_bundle.get("mapping", {}) or {}
@@ -516,7 +553,9 @@ def ingest_job(self, job_id: str) -> dict[str, Any]:
                     reviews=reviews,
                     naver_rating_summary=naver_rating_summary,
                 )
-                trend_payload = crawl_instagram_trend(item["kakao_place_id"], item.get("place_name"))
+                trend_payload = crawl_instagram_trend(
+                    item["kakao_place_id"], item.get("place_name")
+                ).to_dict()
 
                 _write_raw_to_mongo(
                     mongo_db=mongo_db,
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import ANY, MagicMock, patch
+
+import tasks
+from crawlers.naver_place import NaverCrawlResult
+
+
+class IngestJobTests(unittest.TestCase):
+    def test_ingest_job_crawls_items_in_one_batch_and_writes_each_row(self):
+        items = [
+            {"id": 1, "kakao_place_id": "k1", "place_name": "첫번째", "x": "127.0", "y": "37.5"},
+            {"id": 2, "kakao_place_id": "k2", "place_name": "두번째", "x": None, "y": None},
+        ]
+        results = {
+            "k1": NaverCrawlResult(mapping={"naver_place_id": "1"}, status="COMPLETED", skip_reason=None),
+            "k2": NaverCrawlResult(mapping={}, status="SKIPPED", skip_reason="no_candidates"),
+        }
+        places_seen: list[dict] = []
+
+        def fake_batch(places):
+            places_seen.extend(places)
+            return results
+
+        with patch.object(tasks, "_get_postgres_connection", return_value=MagicMock()), patch.object(
+            tasks, "_get_mongo_client_and_db", return_value=(MagicMock(), MagicMock())
+        ), patch.object(tasks, "_job_exists", return_value=True), patch.object(tasks, "_set_job_status"), patch.object(
+            tasks, "_get_job_items", return_value=items
+        ), patch.object(
+            tasks, "batch_fetch_kakao_place_contexts", return_value={"k1": {"address": "서울"}}
+        ), patch.object(tasks, "crawl_naver_place_batch", side_effect=fake_batch) as batch, patch.object(
+            tasks, "_write_raw_to_mongo"
+        ) as write_raw, patch.object(tasks, "_upsert_place_ingestion_feature") as upsert, patch.object(
+            tasks, "_set_item_status"
+        ) as set_status, patch.object(tasks, "_set_item_skipped") as set_skipped:
+            summary = tasks.ingest_job.run("job-1")
+
+        self.assertEqual(batch.call_count, 1)
+        self.assertEqual([place["kakao_place_id"] for place in places_seen], ["k1", "k2"])
+        self.assertEqual(places_seen[0]["kakao_context"], {"address": "서울"})
+        self.assertEqual(write_raw.call_count, 2)
+        self.assertEqual(upsert.call_count, 2)
+        set_status.assert_any_call(ANY, "1", "COMPLETED")
+        set_skipped.assert_called_once()
+        self.assertEqual(summary["completed_items"], 2)
+        self.assertEqual(summary["failed_items"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
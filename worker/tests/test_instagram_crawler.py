@@ -0,0 +1,22 @@
+import json
+import unittest
+
+from crawlers.instagram import crawl_instagram_trend
+
+
+class InstagramTrendTests(unittest.TestCase):
+    def test_raw_payload_is_deterministic_and_json_round_trips(self):
+        first = crawl_instagram_trend("kakao-1", "유어아트")
+        second = crawl_instagram_trend("kakao-1", None)
+
+        self.assertEqual(
+            first.raw_payload,
+            {"source": "placeholder", "seed": 613, "notes": "Deterministic placeholder metric"},
+        )
+        self.assertEqual(second.raw_payload, first.raw_payload)
+        self.assertEqual(json.loads(json.dumps(first.to_dict()))["raw_payload"], first.raw_payload)
+        self.assertEqual((first.count_7d, first.count_30d), (second.count_7d, second.count_30d))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import asyncio
 import sys
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -79,21 +81,57 @@ class NaverPlaceCrawlerTests(unittest.TestCase):
             "&nso_path=type%5Eplace%3Bname%5E%EC%9C%A0%EC%96%B4%EC%95%84%ED%8A%B8"
             "%3Bcode%5E1593950399%3Blongitude%5E127.3646769%3Blatitude%5E36.3574028"
         )
-        anchor_valid = MagicMock()
-        anchor_valid.get_attribute.side_effect = lambda attr: href if attr == "href" else None
-        anchor_invalid = MagicMock()
-        anchor_invalid.get_attribute.side_effect = lambda attr: "/search.naver?where=m" if attr == "href" else None
+        page = MagicMock()
+        page.url = "https://m.search.naver.com/search.naver"
+        page.evaluate.return_value = [href, "/search.naver?where=m", None]
 
-        locator = MagicMock()
-        locator.count.return_value = 2
-        locator.nth.side_effect = lambda index: [anchor_valid, anchor_invalid][index]
+        lookup = naver_place._extract_route_coord_lookup(page, naver_place._load_config())
+        self.assertEqual(lookup["1593950399"], (127.3646769, 36.3574028))
 
+    def test_extract_reviews_uses_single_batch_per_selector(self):
+        locator = MagicMock()
+        locator.evaluate_all.return_value = [
+            {"review_id": "r1", "content": "맛있어요 더보기", "author": "u1", "posted_at": "2025.01.01."},
+            {"review_id": "r2", "content": "더보기", "author": "u2", "posted_at": None},
+            {"review_id": None, "content": None, "author": None, "posted_at": None},
+        ]
         page = MagicMock()
-        page.url = "https://m.search.naver.com/search.naver"
         page.locator.return_value = locator
 
-        lookup = naver_place._extract_route_coord_lookup(page)
-        self.assertEqual(lookup["1593950399"], (127.3646769, 36.3574028))
+        reviews = naver_place._extract_reviews(page, "123")
+
+        self.assertEqual(locator.evaluate_all.call_count, len(naver_place.REVIEW_ITEM_SELECTORS))
+        locator.nth.assert_not_called()
+        self.assertEqual(reviews[0]["content"], "맛있어요")
+        self.assertEqual(reviews[0]["posted_at_iso"], "2025-01-01T00:00:00")
+        self.assertEqual({review["review_id"] for review in reviews}, {"r1"})
+
+    def test_json_mapping_candidates_from_captured_search_response(self):
+        response = MagicMock()
+        response.headers = {"content-type": "application/json;charset=UTF-8"}
+        response.json.return_value = {
+            "result": {
+                "place": {
+                    "list": [
+                        {
+                            "id": "1593950399",
+                            "name": "유어아트",
+                            "x": "127.3646769",
+                            "y": "36.3574028",
+                            "roadAddress": "대전 서구 한밭대로592번길 11",
+                            "category": [{"id": "1", "name": "갤러리"}],
+                        }
+                    ]
+                }
+            }
+        }
+
+        candidates = naver_place._json_mapping_candidates([response], "https://map.naver.com/p/search/x")
+
+        self.assertEqual(len(candidates), 1)
+        self.assertEqual(candidates[0]["naver_place_id"], "1593950399")
+        self.assertEqual((candidates[0]["x"], candidates[0]["y"]), (127.3646769, 36.3574028))
+        self.assertEqual(candidates[0]["snippet"], "대전 서구 한밭대로592번길 11")
 
     def test_mapping_score_selection_prefers_better_combined_score(self):
         candidates = [
@@ -189,6 +227,47 @@ class NaverPlaceCrawlerTests(unittest.TestCase):
         self.assertIsNone(best)
         self.assertEqual(len(scored), 2)
 
+    def test_jaccard_name_ratio_mode(self):
+        self.assertEqual(naver_place._jaccard_ratio("강남볼링장", "강남볼링장"), 1.0)
+        self.assertEqual(naver_place._jaccard_ratio("카페", "볼링"), 0.0)
+
+        with patch.object(naver_place, "NAME_RATIO_USE_JACCARD", True):
+            naver_place._clear_name_caches()
+            try:
+                nearby = naver_place._name_similarity("강남 볼링장", "강남역 볼링센터")
+                unrelated = naver_place._name_similarity("강남 볼링장", "스타벅스 역삼점")
+            finally:
+                naver_place._clear_name_caches()
+
+        self.assertGreater(nearby, unrelated)
+
+    def test_url_template_hints_prefer_last_working_template(self):
+        hints = naver_place._TemplateHintCache(max_entries=1)
+        templates = ["a/{place_id}", "b/{place_id}"]
+
+        hints.record("1", templates, "b/{place_id}")
+        self.assertEqual(hints.order("1", templates), ["b/{place_id}", "a/{place_id}"])
+
+        hints.record("2", templates, "b/{place_id}")
+        self.assertEqual(hints.order("1", templates), templates)
+
+        hints.record("2", templates, None)
+        self.assertEqual(hints.order("2", templates), templates)
+
+    def test_wait_for_count_increase_ends_early_or_after_paced_timeout(self):
+        config = naver_place._load_config()
+        page = MagicMock()
+
+        self.assertTrue(naver_place._wait_for_count_increase(page, "li", 3, config))
+        self.assertEqual(page.wait_for_function.call_args.kwargs["arg"], ["li", 3])
+
+        page.wait_for_function.side_effect = naver_place.PlaywrightTimeoutError("timeout")
+        self.assertFalse(naver_place._wait_for_count_increase(page, "li", 3, config))
+        page.wait_for_timeout.assert_not_called()
+
+        self.assertFalse(naver_place._wait_for_count_increase(page, "li", None, config))
+        page.wait_for_timeout.assert_called_once()
+
     def test_no_growth_guard_stops_after_limit(self):
         guard = naver_place._NoGrowthGuard(limit=2, baseline=5)
 
@@ -198,6 +277,15 @@ class NaverPlaceCrawlerTests(unittest.TestCase):
         self.assertFalse(guard.observe(6))
         self.assertTrue(guard.observe(6))
 
+    def test_no_growth_guard_observe_delta_matches_counts(self):
+        guard = naver_place._NoGrowthGuard(limit=2, baseline=5)
+
+        self.assertFalse(guard.observe_delta(0))
+        self.assertFalse(guard.observe_delta(1))
+        self.assertEqual(guard.last_count, 6)
+        self.assertFalse(guard.observe_delta(0))
+        self.assertTrue(guard.observe_delta(0))
+
     def test_review_and_photo_dedup(self):
         deduped_reviews = naver_place._dedupe_reviews(
             [
@@ -239,6 +327,361 @@ class NaverPlaceCrawlerTests(unittest.TestCase):
             "https://ldb-phinf.pstatic.net/abc.jpg",
         )
 
+    def test_browser_sessions_reuse_pooled_browser_with_fresh_contexts(self):
+        fake_playwright_factory = MagicMock()
+        fake_browser = fake_playwright_factory.return_value.start.return_value.chromium.launch.return_value
+        fake_browser.is_connected.return_value = True
+        fake_browser.new_context.side_effect = lambda **kwargs: MagicMock()
+        config = naver_place._load_config()
+
+        with patch.object(naver_place, "sync_playwright", fake_playwright_factory), patch.object(
+            naver_place._BROWSER_POOL_LOCAL, "pool", naver_place._BrowserPool(), create=True
+        ):
+            first = naver_place._create_browser_session(config)
+            naver_place._close_browser_session(first, config)
+            second = naver_place._create_browser_session(config)
+            naver_place._close_browser_session(second, config)
+
+        self.assertEqual(fake_playwright_factory.return_value.start.call_count, 1)
+        self.assertEqual(fake_browser.new_context.call_count, 2)
+        self.assertIsNot(first.context, second.context)
+        first.context.close.assert_called_once()
+        second.context.close.assert_called_once()
+
+    def test_browser_pool_recycles_after_max_uses_when_idle(self):
+        fake_playwright_factory = MagicMock()
+        fake_browser = fake_playwright_factory.return_value.start.return_value.chromium.launch.return_value
+        fake_browser.is_connected.return_value = True
+        config = naver_place.NaverCrawlerConfig(**{**naver_place._load_config().__dict__, "browser_max_uses": 2})
+
+        with patch.object(naver_place, "sync_playwright", fake_playwright_factory), patch.object(
+            naver_place._BROWSER_POOL_LOCAL, "pool", naver_place._BrowserPool(), create=True
+        ):
+            outer = naver_place._create_browser_session(config)
+            inner = naver_place._create_browser_session(config)
+            naver_place._close_browser_session(inner, config)
+            self.assertEqual(fake_browser.close.call_count, 0)
+            naver_place._close_browser_session(outer, config)
+            naver_place._close_browser_session(naver_place._create_browser_session(config), config)
+
+        self.assertEqual(fake_browser.close.call_count, 1)
+        self.assertEqual(fake_playwright_factory.return_value.start.call_count, 2)
+
+    def test_browser_pool_still_recycles_after_new_context_fails(self):
+        fake_playwright_factory = MagicMock()
+        fake_browser = fake_playwright_factory.return_value.start.return_value.chromium.launch.return_value
+        fake_browser.is_connected.return_value = True
+        fake_browser.new_context.side_effect = [RuntimeError("browser disconnected"), MagicMock(), MagicMock()]
+        config = naver_place.NaverCrawlerConfig(**{**naver_place._load_config().__dict__, "browser_max_uses": 1})
+        pool = naver_place._BrowserPool()
+
+        with patch.object(naver_place, "sync_playwright", fake_playwright_factory), patch.object(
+            naver_place._BROWSER_POOL_LOCAL, "pool", pool, create=True
+        ):
+            with self.assertRaises(RuntimeError):
+                naver_place._create_browser_session(config)
+            self.assertEqual((pool.checked_out, pool.uses), (0, 0))
+
+            naver_place._close_browser_session(naver_place._create_browser_session(config), config)
+            naver_place._close_browser_session(naver_place._create_browser_session(config), config)
+
+        self.assertEqual(fake_browser.close.call_count, 1)
+
+    def test_launch_browser_prefers_cdp_endpoint_and_falls_back_to_launch(self):
+        playwright = MagicMock()
+        base = naver_place._load_config().__dict__
+        config = naver_place.NaverCrawlerConfig(**{**base, "browser_cdp_endpoint": "http://chromium:9222"})
+
+        browser = naver_place._launch_browser(playwright, config)
+        self.assertIs(browser, playwright.chromium.connect_over_cdp.return_value)
+        playwright.chromium.launch.assert_not_called()
+
+        playwright.chromium.connect_over_cdp.side_effect = RuntimeError("refused")
+        browser = naver_place._launch_browser(playwright, config)
+        self.assertIs(browser, playwright.chromium.launch.return_value)
+
+    def test_bundle_crawls_photos_on_prefetched_second_page(self):
+        fake_session = MagicMock()
+        photo_page = fake_session.context.new_page.return_value
+        mapping = {"crawlable": True, "naver_place_id": "123", "reason": None}
+
+        with patch.object(naver_place, "resolve_naver_place_mapping", return_value=mapping), patch.object(
+            naver_place, "_create_browser_session", return_value=fake_session
+        ), patch.object(naver_place, "_close_browser_session", return_value=None), patch.object(
+            naver_place, "_crawl_reviews_with_page", return_value=([], {})
+        ) as crawl_reviews, patch.object(
+            naver_place, "_crawl_photos_with_page", return_value=[]
+        ) as crawl_photos:
+            result = naver_place.crawl_naver_place_bundle("kakao-1", "유어아트")
+
+        self.assertEqual(result["status"], "COMPLETED")
+        self.assertIs(crawl_reviews.call_args.args[0], fake_session.page)
+        self.assertIs(crawl_photos.call_args.args[0], photo_page)
+        self.assertEqual(
+            crawl_photos.call_args.kwargs["prefetched_url"],
+            naver_place.PHOTO_URLS[0].format(place_id="123"),
+        )
+        photo_page.goto.assert_called_once()
+        self.assertEqual(photo_page.goto.call_args.kwargs["wait_until"], "commit")
+        photo_page.close.assert_called_once()
+
+    def test_place_batch_dedupes_places_and_isolates_failures(self):
+        def fake_result(kakao_place_id, place_name, **kwargs):
+            if kakao_place_id == "bad":
+                raise RuntimeError("boom")
+            return naver_place.NaverCrawlResult(mapping={"place_name": place_name}, status="COMPLETED", skip_reason=None)
+
+        places = [
+            {"kakao_place_id": "a", "place_name": "첫번째"},
+            {"kakao_place_id": "bad", "place_name": "실패"},
+            {"kakao_place_id": "a", "place_name": "중복"},
+        ]
+        naver_place.bust_bundle_cache()
+        self.addCleanup(naver_place.bust_bundle_cache)
+        with patch.object(naver_place, "_crawl_naver_place_result", side_effect=fake_result) as crawl:
+            results = naver_place.crawl_naver_place_batch(places, concurrency=2)
+            self.assertEqual(crawl.call_count, 2)
+            self.assertEqual(list(results), ["a", "bad"])
+            self.assertEqual(results["a"].mapping, {"place_name": "첫번째"})
+            self.assertEqual(results["bad"].status, "SKIPPED")
+            self.assertEqual(results["bad"].skip_reason, "crawler_error")
+            self.assertEqual(results["bad"].mapping["kakao_place_id"], "bad")
+
+            # Completed places come back from the bundle cache; failed ones are crawled again.
+            naver_place.crawl_naver_place_batch(places, concurrency=2)
+            self.assertEqual(crawl.call_count, 3)
+
+    def test_adaptive_limiter_halves_on_failure_and_grows_on_success(self):
+        limiter = naver_place._AdaptiveLimiter(initial=4, maximum=5, increase_after=2)
+        for ok in (False, True, True, True, True):
+            limiter.acquire()
+            limiter.release(ok)
+
+        self.assertEqual((limiter.limit, limiter.in_flight), (4, 0))
+
+    def test_place_batch_runs_without_an_event_loop_and_inside_one(self):
+        def fake_result(kakao_place_id, place_name, **kwargs):
+            return naver_place.NaverCrawlResult(mapping={}, status="PARTIAL", skip_reason=None)
+
+        places = [{"kakao_place_id": "a", "place_name": "첫번째"}, {"kakao_place_id": "b", "place_name": "두번째"}]
+
+        async def from_running_loop():
+            sync_results = naver_place.crawl_naver_place_batch(places, concurrency=2)
+            async_results = await naver_place.crawl_naver_place_bundle_many(places, concurrency=2)
+            return list(sync_results), list(async_results)
+
+        with patch.object(naver_place, "_crawl_naver_place_result", side_effect=fake_result):
+            self.assertEqual(list(naver_place.crawl_naver_place_batch(places, concurrency=2)), ["a", "b"])
+            self.assertEqual(asyncio.run(from_running_loop()), (["a", "b"], ["a", "b"]))
+
+    def test_place_batch_reuses_crawl_threads_across_concurrency_values(self):
+        pool_threads: dict[int, threading.Thread] = {}
+        limits: list[int] = []
+
+        def fake_limited(limiter, kakao_place_id, place):
+            limits.append(limiter.maximum)
+            pool_threads[id(naver_place._get_browser_pool())] = threading.current_thread()
+            return naver_place.NaverCrawlResult(mapping={}, status="PARTIAL", skip_reason=None)
+
+        base = naver_place._load_config().__dict__
+        config = naver_place.NaverCrawlerConfig(**{**base, "bundle_concurrency": 2, "bundle_max_concurrency": 2})
+        with patch.object(naver_place, "_BUNDLE_EXECUTOR", None), patch.object(
+            naver_place, "_BUNDLE_EXECUTOR_WORKERS", 0
+        ), patch.object(naver_place, "_BROWSER_POOLS", []), patch.object(
+            naver_place, "_load_config", return_value=config
+        ), patch.object(naver_place, "_crawl_place_limited", side_effect=fake_limited):
+            places = [{"kakao_place_id": f"p{index}", "place_name": "장소"} for index in range(6)]
+            naver_place.crawl_naver_place_batch(places[:3], concurrency=1)
+            executor = naver_place._bundle_executor()
+            naver_place.crawl_naver_place_batch(places[3:], concurrency=5)
+
+            self.assertIs(naver_place._bundle_executor(), executor)
+            pools = list(naver_place._BROWSER_POOLS)
+            self.addCleanup(executor.shutdown, wait=True)
+
+        self.assertLessEqual(len(pools), 2)
+        self.assertTrue(all(pool_threads[id(pool)].is_alive() for pool in pools))
+        self.assertEqual(max(limits), 2)
+
+    def test_shutdown_closes_each_browser_pool_on_its_own_thread(self):
+        owners: dict[int, int] = {}
+        closed_on: dict[int, int] = {}
+
+        def make_pool():
+            pool = naver_place._get_browser_pool()
+            owners[id(pool)] = threading.get_ident()
+            return pool
+
+        def record_shutdown(pool):
+            closed_on[id(pool)] = threading.get_ident()
+
+        config = naver_place.NaverCrawlerConfig(
+            **{**naver_place._load_config().__dict__, "bundle_concurrency": 2, "bundle_max_concurrency": 2}
+        )
+        with patch.object(naver_place, "_BUNDLE_EXECUTOR", None), patch.object(
+            naver_place, "_BUNDLE_EXECUTOR_WORKERS", 0
+        ), patch.object(naver_place, "_BROWSER_POOLS", []), patch.object(
+            naver_place, "_load_config", return_value=config
+        ), patch.object(
+            naver_place._BROWSER_POOL_LOCAL, "pool", None, create=True
+        ), patch.object(naver_place._BrowserPool, "shutdown", record_shutdown):
+            executor = naver_place._bundle_executor()
+            self.addCleanup(executor.shutdown, wait=True)
+            naver_place._run_on_crawl_threads(make_pool)
+            make_pool()
+
+            naver_place.shutdown_browser_pools()
+
+        self.assertEqual(len(owners), 3)
+        self.assertEqual(closed_on, owners)
+
+    def test_reviews_and_photos_share_one_cached_bundle(self):
+        bundle = naver_place.NaverCrawlResult(
+            mapping={},
+            status="COMPLETED",
+            skip_reason=None,
+            reviews=[{"review_id": "r1"}],
+            photos=[{"photo_id": "p1"}],
+        )
+        naver_place.bust_bundle_cache()
+        self.addCleanup(naver_place.bust_bundle_cache)
+
+        with patch.object(naver_place, "_crawl_naver_place_result", return_value=bundle) as crawl:
+            with self.assertWarns(DeprecationWarning):
+                reviews = naver_place.crawl_naver_reviews("kakao-1", "유어아트")
+            with self.assertWarns(DeprecationWarning):
+                photos = naver_place.crawl_naver_photos("kakao-1", "유어아트")
+            self.assertEqual(crawl.call_count, 1)
+
+            naver_place.bust_bundle_cache("kakao-1")
+            with self.assertWarns(DeprecationWarning):
+                naver_place.crawl_naver_photos("kakao-1", "유어아트")
+            self.assertEqual(crawl.call_count, 2)
+
+        self.assertEqual(reviews, bundle.reviews)
+        self.assertEqual(photos, bundle.photos)
+
+    def test_bundle_cache_hands_out_independent_copies(self):
+        crawled = naver_place.NaverCrawlResult(
+            mapping={},
+            status="COMPLETED",
+            skip_reason=None,
+            reviews=[{"review_id": "r1", "content": "좋아요"}],
+            photos=[{"photo_id": "p1", "metadata": {"alt": "사진"}}],
+        )
+        places = [{"kakao_place_id": "kakao-1", "place_name": "유어아트"}]
+        naver_place.bust_bundle_cache()
+        self.addCleanup(naver_place.bust_bundle_cache)
+
+        with patch.object(naver_place, "_crawl_naver_place_result", return_value=crawled) as crawl:
+            first = naver_place.crawl_naver_place_batch(places)["kakao-1"]
+            first.reviews[0]["content"] = "changed"
+            first.photos[0]["metadata"]["alt"] = "changed"
+            first.reviews.append({"review_id": "r2"})
+            crawled.rating_summary["average_rating"] = 1.0
+
+            second = naver_place.crawl_naver_place_batch(places)["kakao-1"]
+
+        self.assertEqual(crawl.call_count, 1)
+        self.assertEqual(second.reviews, [{"review_id": "r1", "content": "좋아요"}])
+        self.assertEqual(second.photos[0]["metadata"], {"alt": "사진"})
+        self.assertEqual(second.rating_summary, {})
+
+    def test_mapping_cache_reuses_mapped_payloads_only(self):
+        mapped = {"status": "MAPPED", "naver_place_id": "123", "crawlable": True}
+        unresolved = {"status": "SKIPPED", "reason": "no_candidates", "crawlable": False}
+
+        with patch.object(naver_place, "_MAPPING_CACHE", naver_place._MappingCache(max_entries=10)), patch.object(
+            naver_place, "redis", None
+        ), patch.object(
+            naver_place, "_resolve_naver_place_mapping_uncached", side_effect=[mapped, unresolved, unresolved]
+        ) as resolve:
+            first = naver_place.resolve_naver_place_mapping("kakao-1", "유어아트", x=127.0, y=37.5)
+            second = naver_place.resolve_naver_place_mapping("kakao-1", "유어아트", x="127.00001", y=37.5)
+            naver_place.resolve_naver_place_mapping("kakao-2", "없는곳")
+            naver_place.resolve_naver_place_mapping("kakao-2", "없는곳")
+
+        self.assertEqual(first, mapped)
+        self.assertEqual(second, mapped)
+        self.assertEqual(resolve.call_count, 3)
+
+    def test_mapping_search_stops_after_exact_name_probe(self):
+        page = MagicMock()
+        exact = {"naver_place_id": "123", "matched_name": "유어아트", "source_url": "https://m.place.naver.com/place/123"}
+
+        with patch.object(naver_place, "_safe_goto", return_value=True) as goto, patch.object(
+            naver_place, "_paced_wait"
+        ), patch.object(naver_place, "_json_mapping_candidates", return_value=[exact]), patch.object(
+            naver_place, "_extract_anchor_mapping_candidates", return_value=0
+        ):
+            candidates = naver_place._extract_mapping_candidates(
+                page, "유어아트", naver_place._load_config(), query_variants=["유어아트", "유어아트 공방"]
+            )
+
+        self.assertEqual(goto.call_count, 1)
+        self.assertEqual([candidate["naver_place_id"] for candidate in candidates], ["123"])
+
+    def test_warm_browser_pool_launches_only_when_reusing_browsers(self):
+        pool = MagicMock()
+        base = naver_place._load_config().__dict__
+
+        with patch.object(naver_place, "sync_playwright", MagicMock()), patch.object(
+            naver_place, "_get_browser_pool", return_value=pool
+        ):
+            with patch.object(
+                naver_place, "_load_config", return_value=naver_place.NaverCrawlerConfig(**{**base, "browser_reuse": True})
+            ):
+                naver_place.warm_browser_pool()
+            with patch.object(
+                naver_place, "_load_config", return_value=naver_place.NaverCrawlerConfig(**{**base, "browser_reuse": False})
+            ):
+                naver_place.warm_browser_pool()
+
+        self.assertEqual(pool.get_browser.call_count, 1)
+
+    def test_resource_blocking_aborts_trackers_of_any_type(self):
+        def route_for(url, resource_type):
+            route = MagicMock()
+            route.request.url = url
+            route.request.resource_type = resource_type
+            naver_place._abort_heavy_resource(route)
+            return route
+
+        tracker_url = "https://wcs.naver.com/b?u=1"
+        self.assertIsNotNone(naver_place.BLOCKED_RESOURCE_URL_PATTERN.search(tracker_url))
+        route_for(tracker_url, "script").abort.assert_called_once()
+        route_for("https://www.googletagmanager.com/gtag/js", "script").abort.assert_called_once()
+        route_for("https://m.place.naver.com/app.svg.js", "script").continue_.assert_called_once()
+
+    def test_closing_a_session_keeps_shared_name_scores_cached(self):
+        naver_place._clear_name_caches()
+        self.addCleanup(naver_place._clear_name_caches)
+        naver_place._name_similarity("유어아트", "유어아트 공방")
+
+        naver_place._close_browser_session(MagicMock(pool=None), naver_place._load_config())
+
+        self.assertEqual(naver_place._name_similarity.cache_info().currsize, 1)
+
+    def test_bundle_to_json_matches_across_inputs_and_encoders(self):
+        result = naver_place.NaverCrawlResult(
+            mapping={"naver_place_id": "123", "matched_name": "유어아트"},
+            status="PARTIAL",
+            skip_reason=None,
+            reviews=[{"content": "분위기가 좋아요"}],
+            warnings=["photo_error:timeout"],
+        )
+
+        encoded: list[bytes] = []
+        for encoder in (naver_place.orjson, None):
+            with self.subTest(orjson=encoder is not None), patch.object(naver_place, "orjson", encoder):
+                from_result = naver_place.bundle_to_json(result)
+                self.assertEqual(naver_place.bundle_to_json(result.to_dict()), from_result)
+                self.assertIn("유어아트".encode("utf-8"), from_result)
+                self.assertNotIn(b"\\u", from_result)
+                encoded.append(from_result)
+
+        self.assertEqual(len(set(encoded)), 1)
+
     def test_mapping_failure_returns_safe_payload(self):
         fake_session = MagicMock()
 